@@ -8,7 +8,7 @@ import asyncio
 from pathlib import Path
 import tempfile
 import uuid
-from typing import Dict, Set
+from typing import Dict, List, Set, Tuple
 from datetime import datetime, timedelta
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
@@ -27,6 +27,9 @@ from database_manager import db_manager
 
 logger = logging.getLogger(__name__)
 
+# Pages translated concurrently while the rest of the document is still being extracted
+MAX_PAGES_IN_FLIGHT = 4
+
 
 class BotHandlers:
     """Handles all bot interactions and message processing."""
@@ -51,6 +54,10 @@ class BotHandlers:
         # Store user files temporarily for format selection
         self.user_files: Dict[int, Dict] = {}
 
+    async def aclose(self):
+        """Release pooled network connections held by the translators."""
+        await self.translator_manager.aclose()
+
     async def _update_progress(self, update: Update, message_id: int, current: int, total: int, description: str):
         """Update progress message with real percentage and estimated time."""
         try:
@@ -522,7 +529,7 @@ class BotHandlers:
 
             # Step 2: Extract text
             await self._update_progress(update, processing_msg.message_id, 2, 3, "استخراج النص من الملف (تصفية أرقام الصفحات)")
-            text_lines = await self.file_processor.extract_text_from_file(file_path)
+            text_lines, translated_pairs = await self._extract_and_translate(file_path)
 
             # Step 3: Finalize preparation
             await self._update_progress(update, processing_msg.message_id, 3, 3, "تحضير خيارات التنسيق")
@@ -535,6 +542,7 @@ class BotHandlers:
             self.user_files[user_id] = {
                 'file_path': file_path,
                 'text_lines': text_lines,
+                'translated_pairs': translated_pairs,
                 'original_filename': document.file_name,
                 'processing_msg_id': processing_msg.message_id
             }
@@ -560,6 +568,30 @@ class BotHandlers:
             )
             self.active_translations.discard(user_id)
 
+    async def _extract_and_translate(self, file_path: Path) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """Extract a file page by page, translating each page while later pages are still being read."""
+        text_lines: List[str] = []
+        tasks: List[asyncio.Task] = []
+        in_flight: Set[asyncio.Task] = set()
+
+        try:
+            async for page_lines in self.file_processor.iter_text_from_file(file_path):
+                text_lines.extend(page_lines)
+                if len(in_flight) >= MAX_PAGES_IN_FLIGHT:
+                    _, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                task = asyncio.create_task(self.translator.translate_lines(page_lines))
+                tasks.append(task)
+                in_flight.add(task)
+
+            page_results = await asyncio.gather(*tasks)
+        finally:
+            # On extraction errors or cancellation, don't leave page translations running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return text_lines, [pair for page_pairs in page_results for pair in page_pairs]
+
     async def handle_format_selection(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle format selection from inline keyboard."""
         query = update.callback_query
@@ -609,12 +641,10 @@ class BotHandlers:
         try:
             # Step 1: Initialize processing
             await self._update_progress_query_real(query, 0, total_lines, "تحضير المعالجة")
-            await asyncio.sleep(0.2)
 
-            # Step 2: Start translation with real progress
-            # Use the local dictionary translator instead of multi-API translator
-            translated_pairs = await self.translator.translate_lines(file_info['text_lines'])
-            
+            # Step 2: Pages were already translated while the file was being extracted
+            translated_pairs = file_info['translated_pairs']
+
             # Simulate progress for consistency with UI
             await self._update_progress_query_real(query, total_lines, total_lines, "إنشاء المستند المترجم")
 
@@ -1076,8 +1106,8 @@ class BotHandlers:
         return self.is_bot_owner(user_id) or self.is_admin(user_id)
 
 
-def register_handlers(application):
-    """Register all bot handlers."""
+def register_handlers(application) -> BotHandlers:
+    """Register all bot handlers and return the handlers instance so its resources can be closed."""
     from config import Config
 
     config = Config()
@@ -1108,4 +1138,6 @@ def register_handlers(application):
     application.add_handler(CommandHandler("dev_db_stats", bot_handlers.dev_db_stats_command))
     application.add_handler(CommandHandler("dev_user_info", bot_handlers.dev_user_info_command))
     application.add_handler(CommandHandler("dev_block_user", bot_handlers.dev_block_user_command))
-    application.add_handler(CommandHandler("dev_unblock_user", bot_handlers.dev_unblock_user_command))
\ No newline at end of file
+    application.add_handler(CommandHandler("dev_unblock_user", bot_handlers.dev_unblock_user_command))
+
+    return bot_handlers
\ No newline at end of file
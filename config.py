@@ -12,6 +12,10 @@ from api_config import api_config
 class Config:
     """Configuration class for bot settings."""
     
+    # Concurrent translation requests per process; also sizes the default thread pool.
+    # Class-level so modules that run before a Config instance exists can read it
+    TRANSLATE_CONCURRENCY = int(os.getenv("TRANSLATE_CONCURRENCY", "16"))
+    
     def __init__(self):
         # Load from centralized API config
         self.api_config = api_config
@@ -33,7 +37,7 @@ class Config:
         
         # File handling configuration  
         self.MAX_FILE_SIZE = 50 * 1024 * 1024  # Increased to 50MB
-        self.SUPPORTED_FORMATS = ['.pdf', '.doc', '.docx']
+        self.SUPPORTED_FORMATS = frozenset(('.pdf', '.doc', '.docx'))
         self.TEMP_DIR = Path(tempfile.gettempdir()) / "telegram_bot"
         self.TEMP_DIR.mkdir(exist_ok=True)
         
@@ -5,19 +5,103 @@ Wrapper for the deep-translator library to provide translation services as an al
 
 import logging
 import asyncio
-from typing import List, Tuple
+import threading
+from typing import List, Optional, Tuple
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
 from deep_translator import GoogleTranslator
+# Aliased: the module-level `deep_translator` instance below shadows the package name
+from deep_translator import google as deep_translator_google
 import re
 
+# orjson parses the (UTF-8 heavy) Arabic responses much faster; stdlib json is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
+# Same Google endpoint deep-translator scrapes, in its JSON flavour
+GOOGLE_TRANSLATE_URL = 'https://translate.googleapis.com/translate_a/single'
+
+# Seconds before a deep-translator request is abandoned; the library itself sets no timeout
+GOOGLE_REQUEST_TIMEOUT = 15
+
+
+class _SessionRequests:
+    """Stand-in for the `requests` module inside deep_translator.google, sending through a pooled session."""
+
+    def __init__(self, session: requests.Session):
+        self._session = session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Issue the library's GET on the keep-alive session, with a timeout."""
+        kwargs.setdefault('timeout', GOOGLE_REQUEST_TIMEOUT)
+        return self._session.get(url, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(requests, name)
+
 
 class DeepTranslatorWrapper:
     """Wrapper for deep-translator library to provide translation services."""
 
     def __init__(self):
         """Initialize the Deep Translator wrapper."""
-        self.translator = GoogleTranslator(source='en', target='ar')
+        # One keep-alive session shared by every worker thread
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        # GoogleTranslator calls the module-level requests.get; route only that module's calls
+        # through the session instead of re-implementing GoogleTranslator.translate
+        deep_translator_google.requests = _SessionRequests(self._session)
+
+        # GoogleTranslator mutates its URL params per call, so each executor thread gets its own
+        self._local = threading.local()
+
+        # Async HTTP/2 client, created lazily on the running event loop
+        self._http: Optional[httpx.AsyncClient] = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the shared async HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close pooled HTTP connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._session.close()
+
+    async def _translate_async(self, text: str) -> str:
+        """Translate text directly over async HTTP without the thread pool."""
+        params = {'client': 'gtx', 'sl': 'en', 'tl': 'ar', 'dt': 't', 'q': text}
+        response = await self._get_http().get(GOOGLE_TRANSLATE_URL, params=params)
+        response.raise_for_status()
+
+        # Response is [[[translated, original, ...], ...], ...] - one entry per sentence
+        segments = json_loads(response.content)[0] or []
+        return ''.join(segment[0] for segment in segments if segment and segment[0])
+
+    @property
+    def translator(self) -> GoogleTranslator:
+        """Translator bound to the calling thread."""
+        translator = getattr(self._local, 'translator', None)
+        if translator is None:
+            translator = GoogleTranslator(source='en', target='ar')
+            self._local.translator = translator
+        return translator
+
+    def _translate_sync(self, text: str) -> str:
+        """Translate text on the current worker thread."""
+        return self.translator.translate(text)
         
     async def translate_text(self, text: str) -> str:
         """
@@ -36,10 +120,14 @@ class DeepTranslatorWrapper:
             # Preserve mathematical expressions
             text_without_math, math_expressions = self._extract_math_expressions(text)
             
-            # Translate the text
-            translated = await asyncio.get_event_loop().run_in_executor(
-                None, self.translator.translate, text_without_math
-            )
+            # Translate the text natively, falling back to deep-translator on the thread pool
+            try:
+                translated = await self._translate_async(text_without_math)
+            except (httpx.HTTPError, ValueError, LookupError, TypeError) as http_error:
+                logger.warning(f"Async translation failed, falling back to deep-translator: {http_error}")
+                translated = await asyncio.get_event_loop().run_in_executor(
+                    None, self._translate_sync, text_without_math
+                )
             
             # Restore mathematical expressions
             if math_expressions:
@@ -62,16 +150,13 @@ class DeepTranslatorWrapper:
         Returns:
             List of tuples containing (original_text, translated_text)
         """
-        translated_pairs = []
-        
-        for line in lines:
+        async def translate_line(line: str) -> Tuple[str, str]:
             if line.strip():
-                translated = await self.translate_text(line)
-                translated_pairs.append((line, translated))
-            else:
-                translated_pairs.append((line, ""))
-        
-        return translated_pairs
+                return line, await self.translate_text(line)
+            return line, ""
+
+        # Requests run concurrently and share pooled HTTP/2 connections
+        return list(await asyncio.gather(*(translate_line(line) for line in lines)))
 
     def _extract_math_expressions(self, text: str) -> Tuple[str, dict]:
         """Extract mathematical expressions and replace with placeholders."""
@@ -3,9 +3,18 @@ Word document generation module.
 Creates formatted Word documents with original and translated text.
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from docx import Document
@@ -33,6 +42,283 @@ from ui_config import ui_config
 
 logger = logging.getLogger(__name__)
 
+# Leading numbering ("1-", "2.", "3)") or bracketed references ("[1]") added by translation
+_TRANSLATION_NUMBERING_RE = re.compile(r'^\s*\d+[-.)]\s*|\[\d+\]')
+
+# Arabic letters, supplement and presentation forms
+_ARABIC_RE = re.compile(r'[\u0600-\u06FF\u0750-\u077F\uFB50-\uFDFF\uFE70-\uFEFC]')
+
+# RTL mark, LTR mark and BOM, removed before shaping
+_STRIP_MARKS = str.maketrans('', '', '\u200f\u200e\ufeff')
+
+# Shared run colour; RGBColor is immutable, so one instance serves every run
+_BLACK = RGBColor(0, 0, 0)
+
+# One reshaper for the whole process (default configuration, as arabic_reshaper.reshape uses)
+_RESHAPER = arabic_reshaper.ArabicReshaper()
+
+# Joins many strings into one reshaper call; a control character, so it never joins letters
+_RESHAPE_SEPARATOR = '\x1e'
+
+# Words that mark a line as a title/section heading
+_HEADING_RE = re.compile(r'chapter|section|part|lab|experiment', re.IGNORECASE)
+
+# PDF paragraph styles keyed by their settings; they are never mutated after creation
+_STYLE_CACHE: dict = {}
+_STYLE_LOCK = threading.Lock()
+
+# Below this many pairs, shaping runs in-process; worker startup would cost more than it saves
+_PARALLEL_SHAPE_MIN_PAIRS = 50
+
+# Pairs shaped per worker task (and per batched reshaper call)
+_SHAPE_CHUNK_SIZE = 32
+
+_shape_pool: Optional[ProcessPoolExecutor] = None
+_shape_pool_lock = threading.Lock()
+
+# The pool is started from a worker thread while the event loop runs; forking a
+# multi-threaded process can deadlock the child, so workers come from a fork server
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Documents built at the same time; more than this just fights over the CPU
+_MAX_CONCURRENT_BUILDS = min(4, os.cpu_count() or 2)
+
+# Created per event loop, since main.run_bot starts a new loop on every restart
+_build_semaphore: Optional[asyncio.Semaphore] = None
+_build_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# PDF fonts are registered once per process, whichever generator gets there first
+_FONT_LOCK = threading.Lock()
+_REGISTERED_FONT: Optional[str] = None
+
+# Candidate PDF font families as (family, regular, bold), best Arabic support first
+_FONT_FAMILIES = [
+    ('NotoSansArabic',
+     '/usr/share/fonts/truetype/noto/NotoSansArabic-Regular.ttf',
+     '/usr/share/fonts/truetype/noto/NotoSansArabic-Bold.ttf'),
+    ('LiberationSans',
+     '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+     '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf'),
+    ('DejaVuSans',
+     '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+     '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'),
+]
+
+# Families worth reshaping for; the Helvetica fallback has no Arabic glyphs at all
+_ARABIC_FONT_FAMILIES = frozenset(family for family, _, _ in _FONT_FAMILIES)
+
+
+def _clean_arabic(arabic_text: str) -> str:
+    """Clean Arabic translation while preserving math expressions and symbols."""
+    # Remove leading numbering ("1-", "2.", "3)") and bracketed numbers ([1], [2]) in one pass
+    text = _TRANSLATION_NUMBERING_RE.sub('', arabic_text)
+
+    # Remove any remaining leading/trailing whitespace
+    text = text.strip()
+
+    # Preserve mathematical expressions and symbols
+    # Keep equations, formulas, variables, and mathematical notation intact
+    # This includes: equations (x=y), functions (sin, cos), symbols (∑, ∫, etc.)
+
+    return text
+
+
+@lru_cache(maxsize=ui_config.ARABIC_SHAPE_CACHE_SIZE)
+def _shape_arabic(text: str) -> str:
+    """Clean and shape Arabic text for PDF rendering, cached per distinct string."""
+    # Remove problematic characters (RTL/LTR marks and BOM) in a single pass
+    text = text.translate(_STRIP_MARKS)
+
+    # Handle mathematical and scientific notations by ensuring they are rendered correctly
+    # This might involve specific regex or library calls if complex parsing is needed
+    # For now, we focus on common cases and rely on the Arabic reshaping for general text.
+    # Example: Ensure LaTeX-like math notation is preserved as much as possible
+    # This is a basic approach; advanced math rendering might require dedicated libraries.
+
+    try:
+        # Check if text contains Arabic characters
+        if _ARABIC_RE.search(text):
+            # Properly reshape Arabic text for correct display
+            reshaped_text = _RESHAPER.reshape(text)
+            # Apply bidirectional algorithm for proper RTL display
+            display_text = get_display(reshaped_text)
+            return display_text
+    except Exception as e:
+        logger.warning(f"Failed to reshape Arabic text: {e}")
+        # If reshaping fails, return original text
+        pass
+
+    return text.strip()
+
+
+def _get_style(name: str, parent: str = 'Normal', **attributes) -> ParagraphStyle:
+    """Get a ParagraphStyle for these settings, building it only the first time it is asked for."""
+    key = (name, parent, tuple(sorted(attributes.items())))
+    style = _STYLE_CACHE.get(key)
+    if style is None:
+        with _STYLE_LOCK:
+            style = _STYLE_CACHE.get(key)
+            if style is None:
+                style = ParagraphStyle(name, parent=_sample_styles()[parent], **attributes)
+                _STYLE_CACHE[key] = style
+    return style
+
+
+@lru_cache(maxsize=1)
+def _sample_styles():
+    """reportlab's sample stylesheet, built once."""
+    return getSampleStyleSheet()
+
+
+# Bounded so a session's worth of lines is remembered when both Word and PDF are produced
+@lru_cache(maxsize=8192)
+def _is_heading(text: str) -> bool:
+    """Check if a line looks like a title/heading (short, upper-case, ends with ':' or has a section keyword)."""
+    stripped = text.strip()
+    if len(stripped) >= 100:
+        return False
+    return text.isupper() or stripped.endswith(':') or _HEADING_RE.search(text) is not None
+
+
+def _w_run(text: str, font_name: str, half_points: str, bold: bool):
+    """Build a black <w:r> with the given font, size (half-points) and weight."""
+    run = OxmlElement('w:r')
+    rPr = OxmlElement('w:rPr')
+
+    fonts = OxmlElement('w:rFonts')
+    fonts.set(qn('w:ascii'), font_name)
+    fonts.set(qn('w:hAnsi'), font_name)
+    rPr.append(fonts)
+
+    if bold:
+        rPr.append(OxmlElement('w:b'))
+
+    color = OxmlElement('w:color')
+    color.set(qn('w:val'), '000000')
+    rPr.append(color)
+
+    sz = OxmlElement('w:sz')
+    sz.set(qn('w:val'), half_points)
+    rPr.append(sz)
+    run.append(rPr)
+
+    t = OxmlElement('w:t')
+    t.text = text
+    if text != text.strip():
+        t.set(qn('xml:space'), 'preserve')
+    run.append(t)
+    return run
+
+
+def _fast_bilingual_paragraph(doc, english: str, arabic: str, size: float,
+                              bold: bool = False, alignment: str = 'both', space_after: float = 6):
+    """
+    Append an English line and its Arabic translation as one paragraph.
+
+    Builds the <w:p> directly with OxmlElement rather than going through
+    add_paragraph()/add_run(), which create wrapper objects and run a
+    property setter per font attribute. Sections are separated by
+    space_after (points) on the paragraph itself, not by an empty paragraph.
+    """
+    half_points = str(int(round(size * 2)))
+
+    p = OxmlElement('w:p')
+    pPr = OxmlElement('w:pPr')
+    spacing = OxmlElement('w:spacing')
+    spacing.set(qn('w:after'), str(int(round(space_after * 20))))
+    pPr.append(spacing)
+    jc = OxmlElement('w:jc')
+    jc.set(qn('w:val'), alignment)
+    pPr.append(jc)
+    p.append(pPr)
+
+    p.append(_w_run(english, 'Times New Roman', half_points, bold))
+
+    # Line break between English and Arabic
+    br_run = OxmlElement('w:r')
+    br_run.append(OxmlElement('w:br'))
+    p.append(br_run)
+
+    p.append(_w_run(arabic, 'Arial Unicode MS', half_points, bold))
+
+    doc.element.body.insert_element_before(p, 'w:sectPr')
+    return p
+
+
+def _shape_batch(texts: List[str]) -> List[str]:
+    """
+    Shape many strings with a single reshaper pass.
+
+    Distinct Arabic strings are joined with _RESHAPE_SEPARATOR, reshaped
+    once and split back; BiDi reordering still runs per string. Anything
+    that can't go through the batch falls back to _shape_arabic.
+    """
+    texts = [text.translate(_STRIP_MARKS) for text in texts]
+    arabic_texts = list(dict.fromkeys(
+        text for text in texts if _RESHAPE_SEPARATOR not in text and _ARABIC_RE.search(text)
+    ))
+
+    shaped = {}
+    if arabic_texts:
+        try:
+            pieces = _RESHAPER.reshape(_RESHAPE_SEPARATOR.join(arabic_texts)).split(_RESHAPE_SEPARATOR)
+            if len(pieces) == len(arabic_texts):
+                shaped = {text: get_display(piece) for text, piece in zip(arabic_texts, pieces)}
+        except Exception as e:
+            logger.warning(f"Batch reshaping failed, shaping one by one: {e}")
+            shaped = {}
+
+    return [shaped[text] if text in shaped else _shape_arabic(text) for text in texts]
+
+
+def _shape_chunk(pairs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Clean and shape the translations of a run of pairs; top-level so worker processes can pickle it."""
+    display_texts = _shape_batch([_clean_arabic(translated_text) for _, translated_text in pairs])
+    return [(original_text, display_text) for (original_text, _), display_text in zip(pairs, display_texts)]
+
+
+def _get_build_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent document builds on the running event loop."""
+    global _build_semaphore, _build_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _build_semaphore is None or _build_semaphore_loop is not loop:
+        _build_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_BUILDS)
+        _build_semaphore_loop = loop
+    return _build_semaphore
+
+
+def _get_shape_pool() -> ProcessPoolExecutor:
+    """Get the shared shaping process pool, starting it on first use."""
+    global _shape_pool
+    with _shape_pool_lock:
+        if _shape_pool is None:
+            # Sized like the build cap, so concurrent builds can't oversubscribe the CPUs
+            _shape_pool = ProcessPoolExecutor(max_workers=_MAX_CONCURRENT_BUILDS, mp_context=_POOL_CONTEXT)
+        return _shape_pool
+
+
+def _shape_pairs(translated_pairs: List[Tuple[str, str]], reshape: bool = True) -> List[Tuple[str, str]]:
+    """Clean and shape all translations, spreading large documents across CPU cores."""
+    global _shape_pool
+    if not reshape:
+        # The PDF font can't draw Arabic glyphs, so reshaping and BiDi would be wasted work
+        return [(original_text, _clean_arabic(translated_text).translate(_STRIP_MARKS).strip())
+                for original_text, translated_text in translated_pairs]
+
+    if len(translated_pairs) >= _PARALLEL_SHAPE_MIN_PAIRS:
+        try:
+            chunks = [translated_pairs[i:i + _SHAPE_CHUNK_SIZE]
+                      for i in range(0, len(translated_pairs), _SHAPE_CHUNK_SIZE)]
+            return [pair for chunk in _get_shape_pool().map(_shape_chunk, chunks) for pair in chunk]
+        except BrokenProcessPool as e:
+            logger.warning(f"Shaping pool failed, shaping in-process: {e}")
+            with _shape_pool_lock:
+                _shape_pool = None
+
+    return _shape_chunk(translated_pairs)
+
 
 # Custom SimpleDocTemplate to disable page numbers
 class SimpleDocTemplateNoPageNumbers(SimpleDocTemplate):
@@ -43,62 +329,63 @@ class SimpleDocTemplateNoPageNumbers(SimpleDocTemplate):
 class WordDocumentGenerator:
     """Generates Word documents with original and translated text."""
 
-    def __init__(self):
-        self._arabic_fonts_registered = False
-        self._registered_font = 'Helvetica'
+    # Serialized default python-docx template, loaded once and reused for every document
+    _TEMPLATE_BYTES: Optional[bytes] = None
+
+    @classmethod
+    def _new_document(cls):
+        """Create an empty Word document from the cached default template."""
+        if cls._TEMPLATE_BYTES is None:
+            buffer = BytesIO()
+            Document().save(buffer)
+            cls._TEMPLATE_BYTES = buffer.getvalue()
+        return Document(BytesIO(cls._TEMPLATE_BYTES))
+
+    @property
+    def _registered_font(self) -> str:
+        """Font family registered for PDF output (shared by every generator in the process)."""
+        return _REGISTERED_FONT or 'Helvetica'
+
+    @property
+    def _font_has_arabic(self) -> bool:
+        """Whether the registered PDF font is one of the Arabic-capable families (not the Helvetica fallback)."""
+        return _REGISTERED_FONT in _ARABIC_FONT_FAMILIES
 
     def _setup_arabic_fonts(self):
         """Register Arabic-compatible fonts for PDF generation."""
-        if self._arabic_fonts_registered:
-            return
-
-        try:
-            # Try to register Noto Sans Arabic first (best Arabic support)
-            font_paths = [
-                '/usr/share/fonts/truetype/noto/NotoSansArabic-Regular.ttf',
-                '/usr/share/fonts/truetype/noto/NotoSansArabic-Bold.ttf',
-                '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
-                '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf',
-                '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-                '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
-            ]
-
-            registered_font = None
-            for font_path in font_paths:
-                try:
-                    if 'NotoSansArabic' in font_path:
-                        font_name = 'NotoSansArabic-Bold' if 'Bold' in font_path else 'NotoSansArabic'
-                        pdfmetrics.registerFont(TTFont(font_name, font_path))
-                        registered_font = 'NotoSansArabic'
-                        addMapping('NotoSansArabic', 0, 0, 'NotoSansArabic')
-                        addMapping('NotoSansArabic', 1, 0, 'NotoSansArabic-Bold')
-                    elif 'Liberation' in font_path:
-                        font_name = 'LiberationSans-Bold' if 'Bold' in font_path else 'LiberationSans'
-                        pdfmetrics.registerFont(TTFont(font_name, font_path))
-                        registered_font = 'LiberationSans'
-                        addMapping('LiberationSans', 0, 0, 'LiberationSans')
-                        addMapping('LiberationSans', 1, 0, 'LiberationSans-Bold')
-                    elif 'DejaVu' in font_path:
-                        font_name = 'DejaVuSans-Bold' if 'Bold' in font_path else 'DejaVuSans'
-                        pdfmetrics.registerFont(TTFont(font_name, font_path))
-                        registered_font = 'DejaVuSans'
-                        addMapping('DejaVuSans', 0, 0, 'DejaVuSans')
-                        addMapping('DejaVuSans', 1, 0, 'DejaVuSans-Bold')
-
-                    if registered_font:
+        global _REGISTERED_FONT
+
+        with _FONT_LOCK:
+            if _REGISTERED_FONT is not None:
+                return
+
+            try:
+                registered_font = None
+                for family, regular_path, bold_path in _FONT_FAMILIES:
+                    if not os.path.exists(regular_path):
+                        continue
+
+                    try:
+                        pdfmetrics.registerFont(TTFont(family, regular_path))
+                        bold_name = family
+                        if os.path.exists(bold_path):
+                            bold_name = f'{family}-Bold'
+                            pdfmetrics.registerFont(TTFont(bold_name, bold_path))
+
+                        addMapping(family, 0, 0, family)
+                        addMapping(family, 1, 0, bold_name)
+                        registered_font = family
                         break
 
-                except Exception as font_error:
-                    continue
+                    except Exception as font_error:
+                        logger.warning(f"Failed to register font {family}: {font_error}")
 
-            self._registered_font = registered_font or 'Helvetica'
-            self._arabic_fonts_registered = True
-            logger.info(f"Arabic fonts registered successfully: {self._registered_font}")
+                _REGISTERED_FONT = registered_font or 'Helvetica'
+                logger.info(f"Arabic fonts registered successfully: {_REGISTERED_FONT}")
 
-        except Exception as e:
-            logger.warning(f"Failed to register Arabic fonts: {e}")
-            self._registered_font = 'Helvetica'
-            self._arabic_fonts_registered = True
+            except Exception as e:
+                logger.warning(f"Failed to register Arabic fonts: {e}")
+                _REGISTERED_FONT = 'Helvetica'
 
     async def create_clean_arabic_document(
         self,
@@ -121,28 +408,39 @@ class WordDocumentGenerator:
             Exception: If document creation fails
         """
         try:
-            # Create a new document
-            doc = Document()
+            async with _get_build_semaphore():
+                return await asyncio.to_thread(
+                    self._build_clean_arabic_document, translated_pairs, output_path, original_filename
+                )
+        except Exception as e:
+            logger.error(f"Failed to create Arabic Word document: {e}")
+            raise Exception(f"Arabic document generation failed: {str(e)}")
 
-            # Process each translation - ONLY Arabic text, very simple
-            for i, (original_text, translated_text) in enumerate(translated_pairs, 1):
-                # Clean Arabic translation (remove numbers and formatting)
-                clean_arabic = self._clean_arabic_translation(translated_text)
+    def _build_clean_arabic_document(
+        self,
+        translated_pairs: List[Tuple[str, str]],
+        output_path: Path,
+        original_filename: str
+    ) -> Path:
+        """Build and save the Arabic-only Word document."""
+        # Create a new document
+        doc = self._new_document()
 
-                # Add ONLY Arabic translation - simple paragraph
-                arabic_para = doc.add_paragraph(clean_arabic)
-                arabic_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                arabic_para.runs[0].font.size = Pt(18)
+        # Process each translation - ONLY Arabic text, very simple
+        for original_text, translated_text in translated_pairs:
+            # Clean Arabic translation (remove numbers and formatting)
+            clean_arabic = self._clean_arabic_translation(translated_text)
 
-            # Save the document
-            doc.save(str(output_path))
+            # Add ONLY Arabic translation - simple paragraph
+            arabic_para = doc.add_paragraph(clean_arabic)
+            arabic_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+            arabic_para.runs[0].font.size = Pt(18)
 
-            logger.info(f"Created simple Arabic-only document with {len(translated_pairs)} translations")
-            return output_path
+        # Save the document
+        doc.save(str(output_path))
 
-        except Exception as e:
-            logger.error(f"Failed to create Arabic Word document: {e}")
-            raise Exception(f"Arabic document generation failed: {str(e)}")
+        logger.info(f"Created simple Arabic-only document with {len(translated_pairs)} translations")
+        return output_path
 
     async def create_bilingual_document(
         self,
@@ -165,38 +463,49 @@ class WordDocumentGenerator:
             Exception: If document creation fails
         """
         try:
-            # Create a new document
-            doc = Document()
-
-            # Add header information at the top
-            header_info = doc.add_paragraph()
-            header_run1 = header_info.add_run(f"Translation Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            header_run1.font.size = Pt(12)
-            header_run1.font.name = 'Times New Roman'
-            
-            header_run2 = header_info.add_run("Developer: @dextermorgenk")
-            header_run2.font.size = Pt(12)
-            header_run2.font.name = 'Times New Roman'
-            header_info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Add spacing
-            doc.add_paragraph()
+            async with _get_build_semaphore():
+                return await asyncio.to_thread(
+                    self._build_bilingual_document, translated_pairs, output_path, original_filename
+                )
+        except Exception as e:
+            logger.error(f"Failed to create Word document: {e}")
+            raise Exception(f"Document generation failed: {str(e)}")
 
-            # Process each translation pair with improved formatting
-            for i, (original_text, translated_text) in enumerate(translated_pairs, 1):
-                await self._add_structured_translation_pair(doc, i, original_text, translated_text)
+    def _build_bilingual_document(
+        self,
+        translated_pairs: List[Tuple[str, str]],
+        output_path: Path,
+        original_filename: str
+    ) -> Path:
+        """Build and save the bilingual Word document."""
+        # Create a new document
+        doc = self._new_document()
+
+        # Add header information at the top
+        header_info = doc.add_paragraph()
+        header_run1 = header_info.add_run(f"Translation Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        header_run1.font.size = Pt(12)
+        header_run1.font.name = 'Times New Roman'
+        
+        header_run2 = header_info.add_run("Developer: @dextermorgenk")
+        header_run2.font.size = Pt(12)
+        header_run2.font.name = 'Times New Roman'
+        header_info.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # Add spacing
+        doc.add_paragraph()
 
-            # Save the document
-            doc.save(str(output_path))
+        # Process each translation pair with improved formatting
+        for i, (original_text, translated_text) in enumerate(translated_pairs, 1):
+            self._add_structured_translation_pair(doc, i, original_text, translated_text)
 
-            logger.info(f"Created structured bilingual document with {len(translated_pairs)} translation pairs")
-            return output_path
+        # Save the document
+        doc.save(str(output_path))
 
-        except Exception as e:
-            logger.error(f"Failed to create Word document: {e}")
-            raise Exception(f"Document generation failed: {str(e)}")
+        logger.info(f"Created structured bilingual document with {len(translated_pairs)} translation pairs")
+        return output_path
 
-    async def _add_structured_translation_pair(
+    def _add_structured_translation_pair(
         self,
         doc,
         index: int,
@@ -204,73 +513,27 @@ class WordDocumentGenerator:
         translated_text: str
     ):
         """Add a structured translation pair maintaining original document format."""
+        size = ui_config.current_arabic_font_size
         try:
             # Clean translated text first
             clean_arabic = self._clean_arabic_translation(translated_text)
 
             # Check if this is a title/heading (typically shorter text or contains certain formatting)
-            is_heading = len(original_text.strip()) < 100 and (
-                original_text.isupper() or 
-                original_text.strip().endswith(':') or
-                any(word in original_text.lower() for word in ['chapter', 'section', 'part', 'lab', 'experiment'])
-            )
+            is_heading = _is_heading(original_text)
 
             if is_heading:
-                # Format as heading
-                heading_para = doc.add_paragraph()
-                
-                # English heading
-                eng_run = heading_para.add_run(original_text)
-                eng_run.font.name = 'Times New Roman'
-                eng_run.font.size = Pt(ui_config.current_arabic_font_size + 2)
-                eng_run.font.bold = True
-                eng_run.font.color.rgb = RGBColor(0, 0, 0)
-                
-                # Add line break
-                heading_para.add_run('\n')
-                
-                # Arabic heading
-                ar_run = heading_para.add_run(clean_arabic)
-                ar_run.font.name = 'Arial Unicode MS'
-                ar_run.font.size = Pt(ui_config.current_arabic_font_size + 2)
-                ar_run.font.bold = True
-                ar_run.font.color.rgb = RGBColor(0, 0, 0)
-                
-                heading_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
+                # Format as heading: bold, slightly larger, centered
+                _fast_bilingual_paragraph(doc, original_text, clean_arabic, size + 2, bold=True, alignment='center')
             else:
                 # Format as regular content with proper structure
-                content_para = doc.add_paragraph()
-                
-                # English text
-                eng_run = content_para.add_run(original_text)
-                eng_run.font.name = 'Times New Roman'
-                eng_run.font.size = Pt(ui_config.current_arabic_font_size)
-                eng_run.font.color.rgb = RGBColor(0, 0, 0)
-                
-                # Add spacing between English and Arabic
-                content_para.add_run('\n')
-                
-                # Arabic text
-                ar_run = content_para.add_run(clean_arabic)
-                ar_run.font.name = 'Arial Unicode MS'
-                ar_run.font.size = Pt(ui_config.current_arabic_font_size)
-                ar_run.font.color.rgb = RGBColor(0, 0, 0)
-                
-                content_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-
-            # Add spacing between sections
-            if index < len(translated_pairs):
-                spacing_para = doc.add_paragraph()
-                spacing_para.add_run(' ')
-                spacing_para.space_after = Pt(6)
+                _fast_bilingual_paragraph(doc, original_text, clean_arabic, size, alignment='both')
 
         except Exception as e:
             logger.warning(f"Failed to add structured translation pair {index}: {e}")
             # Fallback to simple format
-            await self._add_translation_pair(doc, index, original_text, translated_text)
+            self._add_translation_pair(doc, index, original_text, translated_text)
 
-    async def _add_translation_pair(
+    def _add_translation_pair(
         self,
         doc,
         index: int,
@@ -278,13 +541,14 @@ class WordDocumentGenerator:
         translated_text: str
     ):
         """Add a translation pair to the document with proper paragraph formatting."""
+        size_pt = Pt(ui_config.current_arabic_font_size)
         try:
             # Add English text paragraph (preserving original structure)
             english_para = doc.add_paragraph()
             english_run = english_para.add_run(original_text)
             english_run.font.name = 'Times New Roman'
-            english_run.font.size = Pt(ui_config.current_arabic_font_size)
-            english_run.font.color.rgb = RGBColor(0, 0, 0)
+            english_run.font.size = size_pt
+            english_run.font.color.rgb = _BLACK
             english_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
             # Clean translated text (preserve math symbols and structure)
@@ -294,8 +558,8 @@ class WordDocumentGenerator:
             arabic_para = doc.add_paragraph()
             arabic_run = arabic_para.add_run(clean_arabic)
             arabic_run.font.name = 'Arial Unicode MS'
-            arabic_run.font.size = Pt(ui_config.current_arabic_font_size)
-            arabic_run.font.color.rgb = RGBColor(0, 0, 0)
+            arabic_run.font.size = size_pt
+            arabic_run.font.color.rgb = _BLACK
             arabic_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT  # Right align for Arabic
 
             # Add spacing between translation blocks
@@ -329,27 +593,12 @@ class WordDocumentGenerator:
 
     def _clean_arabic_translation(self, arabic_text: str) -> str:
         """Clean Arabic translation while preserving math expressions and symbols."""
-        import re
-
-        # Only remove leading numbering added by translation (like "1-", "2.", "3)" at the beginning)
-        text = re.sub(r'^\s*\d+[-.)]\s*', '', arabic_text)
-
-        # Remove any brackets with numbers added by translation [1], [2], etc.
-        text = re.sub(r'\[\d+\]', '', text)
-
-        # Remove any remaining leading/trailing whitespace
-        text = text.strip()
-
-        # Preserve mathematical expressions and symbols
-        # Keep equations, formulas, variables, and mathematical notation intact
-        # This includes: equations (x=y), functions (sin, cos), symbols (∑, ∫, etc.)
-        
-        return text
+        return _clean_arabic(arabic_text)
 
     def create_error_document(self, error_message: str, output_path: Path) -> Path:
         """Create a document with error information."""
         try:
-            doc = Document()
+            doc = self._new_document()
 
             title = doc.add_heading('Translation Error', 0)
             title.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -390,103 +639,83 @@ class WordDocumentGenerator:
             Exception: If PDF creation fails
         """
         try:
-            # Create PDF document with simple margins and no page numbers
-            doc = SimpleDocTemplateNoPageNumbers(str(output_path), pagesize=A4,
-                                                 rightMargin=50, leftMargin=50,
-                                                 topMargin=50, bottomMargin=50)
-
-            # Create styles
-            styles = getSampleStyleSheet()
-
-            # Register Arabic-supporting fonts
-            self._setup_arabic_fonts()
-
-            # Very simple text style using UI config
-            arabic_style = ParagraphStyle(
-                'PlainArabicText',
-                parent=styles['Normal'],
-                alignment=TA_RIGHT,
-                fontSize=ui_config.PDF_STYLES['arabic_size'],
-                spaceAfter=ui_config.PDF_STYLES['spacing'],
-                spaceBefore=0,
-                fontName=self._registered_font,
-                leading=ui_config.PDF_STYLES['arabic_size'] + 6,
-                textColor=colors.black,
-                borderWidth=0,
-                borderColor=None,
-                backColor=None
-            )
-
-            # Build plain content - Arabic text only
-            content = []
-
-            # Header information style - centered English text
-            header_style = ParagraphStyle(
-                'HeaderInfo',
-                parent=styles['Normal'],
-                alignment=TA_CENTER,
-                fontSize=14,  # Increased font size
-                spaceAfter=3,
-                spaceBefore=0,
-                fontName=self._registered_font,
-                leading=18,  # Increased leading
-                textColor=colors.black
-            )
-
-            # Add header information in English (centered at top) - no filename
-            content.append(Paragraph(f"Translation Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", header_style))
-            content.append(Paragraph("Developer: @dextermorgenk", header_style))
-            content.append(Spacer(1, 30)) # Increased spacing
-
-            # Add only Arabic translations - completely plain
-            for i, (original_text, translated_text) in enumerate(translated_pairs, 1):
-                # Clean Arabic translation
-                clean_arabic = self._clean_arabic_translation(translated_text)
-                display_arabic = self._clean_text_for_pdf(clean_arabic)
-
-                # Add simple Arabic text paragraph
-                content.append(Paragraph(display_arabic, arabic_style))
-
-                # Small space between paragraphs
-                content.append(Spacer(1, 10)) # Increased spacing
-
-            # Build PDF - completely plain
-            doc.build(content)
-
-            logger.info(f"Created plain Arabic PDF with {len(translated_pairs)} translations")
-            return output_path
-
+            async with _get_build_semaphore():
+                return await asyncio.to_thread(
+                    self._build_arabic_pdf, translated_pairs, output_path, original_filename
+                )
         except Exception as e:
             logger.error(f"Failed to create Arabic PDF: {e}")
             raise Exception(f"Arabic PDF generation failed: {str(e)}")
 
+    def _build_arabic_pdf(
+        self,
+        translated_pairs: List[Tuple[str, str]],
+        output_path: Path,
+        original_filename: str
+    ) -> Path:
+        """Build and save the Arabic-only PDF."""
+        # Register Arabic-supporting fonts
+        self._setup_arabic_fonts()
+        registered_font = self._registered_font
+
+        # Very simple text style using UI config
+        pdf_styles = ui_config.PDF_STYLES
+        arabic_style = _get_style(
+            'PlainArabicText',
+            parent='Normal',
+            alignment=TA_RIGHT,
+            fontSize=pdf_styles['arabic_size'],
+            spaceAfter=pdf_styles['spacing'],
+            spaceBefore=0,
+            fontName=registered_font,
+            leading=pdf_styles['arabic_size'] + 6,
+            textColor=colors.black,
+            borderWidth=0,
+            borderColor=None,
+            backColor=None
+        )
+
+        # Build plain content - Arabic text only
+        content = []
+
+        # Header information style - centered English text
+        header_style = _get_style(
+            'HeaderInfo',
+            parent='Normal',
+            alignment=TA_CENTER,
+            fontSize=14,  # Increased font size
+            spaceAfter=3,
+            spaceBefore=0,
+            fontName=registered_font,
+            leading=18,  # Increased leading
+            textColor=colors.black
+        )
+
+        # Add header information in English (centered at top) - no filename
+        content.append(Paragraph(f"Translation Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", header_style))
+        content.append(Paragraph("Developer: @dextermorgenk", header_style))
+        content.append(Spacer(1, 30)) # Increased spacing
+
+        # Add only Arabic translations - completely plain
+        for original_text, display_arabic in _shape_pairs(translated_pairs, self._font_has_arabic):
+            # Add simple Arabic text paragraph, then a small space between paragraphs
+            content.extend((Paragraph(display_arabic, arabic_style), Spacer(1, 10)))  # Increased spacing
+
+        # Build PDF - completely plain, simple margins and no page numbers
+        doc = SimpleDocTemplateNoPageNumbers(str(output_path), pagesize=A4,
+                                             rightMargin=50, leftMargin=50,
+                                             topMargin=50, bottomMargin=50)
+        doc.build(content)
+        _shape_arabic.cache_clear()
+
+        logger.info(f"Created plain Arabic PDF with {len(translated_pairs)} translations")
+        return output_path
+
     def _clean_text_for_pdf(self, text: str) -> str:
         """Clean and properly shape Arabic text for PDF rendering."""
-        # Remove problematic characters
-        text = text.replace('\u200f', '')  # Remove RTL mark
-        text = text.replace('\u200e', '')  # Remove LTR mark
-        text = text.replace('\ufeff', '')  # Remove BOM
-
-        # Handle mathematical and scientific notations by ensuring they are rendered correctly
-        # This might involve specific regex or library calls if complex parsing is needed
-        # For now, we focus on common cases and rely on the Arabic reshaping for general text.
-        # Example: Ensure LaTeX-like math notation is preserved as much as possible
-        # This is a basic approach; advanced math rendering might require dedicated libraries.
-
-        try:
-            # Check if text contains Arabic characters
-            if any('\u0600' <= char <= '\u06FF' for char in text):
-                # Properly reshape Arabic text for correct display
-                reshaped_text = arabic_reshaper.reshape(text)
-                # Apply bidirectional algorithm for proper RTL display
-                display_text = get_display(reshaped_text)
-                return display_text
-        except Exception as e:
-            logger.warning(f"Failed to reshape Arabic text: {e}")
-            # If reshaping fails, return original text
-            pass
-
-        return text.strip()
+        if not self._font_has_arabic:
+            return text.translate(_STRIP_MARKS).strip()
+        return _shape_arabic(text)
 
 
     async def create_bilingual_pdf(
@@ -507,112 +736,113 @@ class WordDocumentGenerator:
             Path to the created PDF document
         """
         try:
-            # Create PDF document with proper margins
-            doc = SimpleDocTemplateNoPageNumbers(str(output_path), pagesize=A4,
-                                                 rightMargin=72, leftMargin=72,
-                                                 topMargin=72, bottomMargin=72)
-
-            # Create styles
-            styles = getSampleStyleSheet()
-
-            # Register Arabic-supporting fonts
-            self._setup_arabic_fonts()
-
-            # Header style
-            header_style = ParagraphStyle(
-                'HeaderInfo',
-                parent=styles['Normal'],
-                alignment=TA_CENTER,
-                fontSize=12,
-                spaceAfter=5,
-                spaceBefore=0,
-                fontName=self._registered_font,
-                leading=16,
-                textColor=colors.black
-            )
-
-            # Heading style for titles/sections
-            heading_style = ParagraphStyle(
-                'SectionHeading',
-                parent=styles['Heading2'],
-                alignment=TA_CENTER,
-                fontSize=16,
-                spaceAfter=12,
-                spaceBefore=12,
-                fontName=self._registered_font,
-                textColor=colors.black,
-                borderWidth=0
-            )
-
-            # English content style
-            english_style = ParagraphStyle(
-                'EnglishContent',
-                parent=styles['Normal'],
-                alignment=TA_JUSTIFY,
-                fontSize=ui_config.PDF_STYLES['english_size'],
-                spaceAfter=4,
-                spaceBefore=0,
-                fontName=self._registered_font,
-                leading=ui_config.PDF_STYLES['english_size'] + 4,
-                textColor=colors.black
-            )
-
-            # Arabic content style
-            arabic_style = ParagraphStyle(
-                'ArabicContent',
-                parent=styles['Normal'],
-                alignment=TA_RIGHT,
-                fontSize=ui_config.PDF_STYLES['arabic_size'],
-                spaceAfter=8,
-                spaceBefore=4,
-                fontName=self._registered_font,
-                leading=ui_config.PDF_STYLES['arabic_size'] + 6,
-                textColor=colors.black
-            )
-
-            # Build structured content
-            content = []
-
-            # Add header information
-            content.append(Paragraph(f"Translation Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", header_style))
-            content.append(Paragraph("Developer: @dextermorgenk", header_style))
-            content.append(Spacer(1, 24))
-
-            # Process each translation pair with structure detection
-            for i, (original_text, translated_text) in enumerate(translated_pairs, 1):
-                clean_arabic = self._clean_arabic_translation(translated_text)
-                display_arabic = self._clean_text_for_pdf(clean_arabic)
-
-                # Detect if this is a heading/title
-                is_heading = len(original_text.strip()) < 100 and (
-                    original_text.isupper() or 
-                    original_text.strip().endswith(':') or
-                    any(word in original_text.lower() for word in ['chapter', 'section', 'part', 'lab', 'experiment'])
+            async with _get_build_semaphore():
+                return await asyncio.to_thread(
+                    self._build_bilingual_pdf, translated_pairs, output_path, original_filename
                 )
-
-                if is_heading:
-                    # Format as heading
-                    combined_heading = f"{original_text}<br/>{display_arabic}"
-                    content.append(Paragraph(combined_heading, heading_style))
-                    content.append(Spacer(1, 12))
-                else:
-                    # Format as regular content
-                    if i > 1:
-                        content.append(Spacer(1, 6))
-                    
-                    content.append(Paragraph(original_text, english_style))
-                    content.append(Paragraph(display_arabic, arabic_style))
-
-            # Build PDF
-            doc.build(content)
-
-            logger.info(f"Created structured bilingual PDF with {len(translated_pairs)} translation pairs")
-            return output_path
-
         except Exception as e:
             logger.error(f"Failed to create bilingual PDF: {e}")
             raise Exception(f"Structured bilingual PDF generation failed: {str(e)}")
 
+    def _build_bilingual_pdf(
+        self,
+        translated_pairs: List[Tuple[str, str]],
+        output_path: Path,
+        original_filename: str
+    ) -> Path:
+        """Build and save the bilingual PDF."""
+        # Register Arabic-supporting fonts
+        self._setup_arabic_fonts()
+        registered_font = self._registered_font
+
+        # Header style
+        header_style = _get_style(
+            'HeaderInfo',
+            parent='Normal',
+            alignment=TA_CENTER,
+            fontSize=12,
+            spaceAfter=5,
+            spaceBefore=0,
+            fontName=registered_font,
+            leading=16,
+            textColor=colors.black
+        )
+
+        # Heading style for titles/sections
+        heading_style = _get_style(
+            'SectionHeading',
+            parent='Heading2',
+            alignment=TA_CENTER,
+            fontSize=16,
+            spaceAfter=12,
+            spaceBefore=12,
+            fontName=registered_font,
+            textColor=colors.black,
+            borderWidth=0
+        )
+
+        # English content style
+        pdf_styles = ui_config.PDF_STYLES
+        english_style = _get_style(
+            'EnglishContent',
+            parent='Normal',
+            alignment=TA_JUSTIFY,
+            fontSize=pdf_styles['english_size'],
+            spaceAfter=4,
+            spaceBefore=0,
+            fontName=registered_font,
+            leading=pdf_styles['english_size'] + 4,
+            textColor=colors.black
+        )
+
+        # Arabic content style
+        arabic_style = _get_style(
+            'ArabicContent',
+            parent='Normal',
+            alignment=TA_RIGHT,
+            fontSize=pdf_styles['arabic_size'],
+            spaceAfter=8,
+            spaceBefore=4,
+            fontName=registered_font,
+            leading=pdf_styles['arabic_size'] + 6,
+            textColor=colors.black
+        )
+
+        # Build structured content
+        content = []
+
+        # Add header information
+        content.append(Paragraph(f"Translation Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", header_style))
+        content.append(Paragraph("Developer: @dextermorgenk", header_style))
+        content.append(Spacer(1, 24))
+
+        # Process each translation pair with structure detection
+        # Clean and shape every translation up front, in parallel for long documents
+        for i, (original_text, display_arabic) in enumerate(_shape_pairs(translated_pairs, self._font_has_arabic), 1):
+            # Detect if this is a heading/title
+            is_heading = _is_heading(original_text)
+
+            if is_heading:
+                # Format as heading
+                combined_heading = f"{original_text}<br/>{display_arabic}"
+                content.extend((Paragraph(combined_heading, heading_style), Spacer(1, 12)))
+            else:
+                # Format as regular content
+                if i > 1:
+                    content.append(Spacer(1, 6))
+                
+                content.extend((Paragraph(original_text, english_style), Paragraph(display_arabic, arabic_style)))
+
+        # Build PDF with proper margins
+        doc = SimpleDocTemplateNoPageNumbers(str(output_path), pagesize=A4,
+                                             rightMargin=72, leftMargin=72,
+                                             topMargin=72, bottomMargin=72)
+        doc.build(content)
+        _shape_arabic.cache_clear()
+
+        logger.info(f"Created structured bilingual PDF with {len(translated_pairs)} translation pairs")
+        return output_path
+
     def _is_arabic(self, text: str) -> bool:
         """Check if the text contains Arabic characters."""
-        return any('\u0600' <= char <= '\u06FF' for char in text)
\ No newline at end of file
+        return bool(_ARABIC_RE.search(text))
\ No newline at end of file
@@ -3,49 +3,60 @@ File handling module for PDF and Word document processing.
 Handles text extraction from various file formats.
 """
 
+import asyncio
 import logging
-import tempfile
+import os
+import re
 from pathlib import Path
-from typing import Optional, List
-import io
+from typing import AsyncIterator, Optional, List
 
-# PDF processing
-import pdfplumber
+# PDF processing: MuPDF-based extraction is much faster than pdfplumber;
+# optional, pdfplumber (imported on first use) is the fallback
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
 
 # Word document processing
 from docx import Document
 
 logger = logging.getLogger(__name__)
 
+# "pymupdf" (default, fast) or "pdfplumber" (slower, better for table-heavy layouts)
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pymupdf").strip().lower()
+
+# Extensions handled by the python-docx extractor
+WORD_FORMATS = frozenset(('.doc', '.docx'))
+
+
+def _open_pdfplumber(path):
+    """Open a PDF with pdfplumber, importing it only when that backend is actually used."""
+    # pdfplumber pulls in pdfminer.six, which is slow to import and unused with PyMuPDF
+    import pdfplumber
+    return pdfplumber.open(path)
+
 
 class FileProcessor:
     """Handles file processing operations for PDF and Word documents."""
     
+    # Common page number patterns, compiled once for every line of every document:
+    # "1", "Page 1", "1/10", "- 5 -", "[1]", "(1)"
+    _PAGE_NUM_RE = re.compile(
+        r'^(?:\d+|Page\s+\d+|\d+\s*/\s*\d+|\-\s*\d+\s*\-|\[\s*\d+\s*\]|\(\s*\d+\s*\))$',
+        re.IGNORECASE
+    )
+    
+    # A non-blank line without its surrounding whitespace
+    _LINE_RE = re.compile(r'^\s*(\S.*?)\s*$', re.MULTILINE)
+    
+    __slots__ = ('supported_formats',)
+    
     def __init__(self):
-        self.supported_formats = ['.pdf', '.doc', '.docx']
+        self.supported_formats = frozenset(('.pdf', '.doc', '.docx'))
     
     def _is_page_number(self, text: str) -> bool:
         """Check if text is likely a page number."""
-        import re
-        
-        # Remove whitespace
-        text = text.strip()
-        
-        # Check for common page number patterns
-        patterns = [
-            r'^\d+$',                    # Just a number (1, 2, 3)
-            r'^Page\s+\d+$',            # "Page 1", "Page 2"
-            r'^\d+\s*/\s*\d+$',         # "1/10", "2 / 15"
-            r'^\-\s*\d+\s*\-$',         # "- 5 -", "-10-"
-            r'^\[\s*\d+\s*\]$',         # "[1]", "[ 5 ]"
-            r'^\(\s*\d+\s*\)$',         # "(1)", "( 5 )"
-        ]
-        
-        for pattern in patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return True
-                
-        return False
+        return self._PAGE_NUM_RE.match(text.strip()) is not None
     
     async def extract_text_from_file(self, file_path: Path) -> List[str]:
         """
@@ -66,7 +77,7 @@ class FileProcessor:
             
             if file_extension == '.pdf':
                 return await self._extract_text_from_pdf(file_path)
-            elif file_extension in ['.doc', '.docx']:
+            elif file_extension in WORD_FORMATS:
                 return await self._extract_text_from_word(file_path)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
@@ -78,63 +89,134 @@ class FileProcessor:
     async def _extract_text_from_pdf(self, file_path: Path) -> List[str]:
         """Extract text from PDF file."""
         try:
-            lines = []
-            
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        # Split by lines and filter empty lines and page numbers
-                        page_lines = []
-                        for line in text.split('\n'):
-                            line = line.strip()
-                            # Skip empty lines and standalone page numbers
-                            if line and not self._is_page_number(line):
-                                page_lines.append(line)
-                        lines.extend(page_lines)
-            
-            if not lines:
-                raise ValueError("No text content found in PDF")
-                
-            logger.info(f"Extracted {len(lines)} lines from PDF")
-            return lines
+            # pdfplumber layout analysis is blocking; keep it off the event loop
+            return await asyncio.to_thread(self._extract_pdf_sync, file_path)
             
         except Exception as e:
             logger.error(f"PDF text extraction failed: {e}")
             raise Exception(f"Failed to extract text from PDF: {str(e)}")
     
-    async def _extract_text_from_word(self, file_path: Path) -> List[str]:
-        """Extract text from Word document."""
-        try:
-            lines = []
-            
-            # Load the document
-            doc = Document(str(file_path))
-            
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                if text:
-                    lines.append(text)
+    def _extract_pdf_sync(self, file_path: Path) -> List[str]:
+        """Extract text lines from a PDF file on the calling thread."""
+        lines = []
+        
+        if PDF_BACKEND == 'pymupdf' and pymupdf is not None:
+            page_texts = self._extract_pages_pymupdf(file_path)
+        else:
+            page_texts = self._extract_pages_pdfplumber(file_path)
+        
+        for text in page_texts:
+            lines.extend(self._page_lines(text))
+        
+        if not lines:
+            raise ValueError("No text content found in PDF")
             
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text = cell.text.strip()
-                        if text:
-                            lines.append(text)
+        logger.info(f"Extracted {len(lines)} lines from PDF")
+        return lines
+    
+    def _page_lines(self, text: Optional[str]) -> List[str]:
+        """Split one page's text into lines, dropping empty lines and standalone page numbers."""
+        if not text:
+            return []
+        
+        # One C-level pass yields every non-blank line already stripped
+        page_num_match = self._PAGE_NUM_RE.match
+        return [line for line in self._LINE_RE.findall(text) if not page_num_match(line)]
+    
+    async def iter_text_from_file(self, file_path: Path) -> AsyncIterator[List[str]]:
+        """
+        Yield the text lines of a file one page at a time.
+        
+        Lets callers start translating early pages while later ones are still
+        being extracted. Word documents are parsed in one go and yielded as a
+        single batch.
+        
+        Args:
+            file_path: Path to the file to process
             
-            if not lines:
-                raise ValueError("No text content found in Word document")
+        Yields:
+            Non-empty lists of text lines, in document order
             
-            logger.info(f"Extracted {len(lines)} lines from Word document")
-            return lines
+        Raises:
+            ValueError: If file format is not supported
+        """
+        file_extension = file_path.suffix.lower()
+        
+        if file_extension in WORD_FORMATS:
+            yield await self._extract_text_from_word(file_path)
+            return
+        if file_extension != '.pdf':
+            raise ValueError(f"Unsupported file format: {file_extension}")
+        
+        use_pymupdf = PDF_BACKEND == 'pymupdf' and pymupdf is not None
+        pdf = await asyncio.to_thread(pymupdf.open if use_pymupdf else _open_pdfplumber, file_path)
+        try:
+            pages = pdf if use_pymupdf else pdf.pages
+            for index in range(len(pages)):
+                text = await asyncio.to_thread(self._page_text, pages, index, use_pymupdf)
+                page_lines = self._page_lines(text)
+                if page_lines:
+                    yield page_lines
+        finally:
+            pdf.close()
+    
+    def _page_text(self, pages, index: int, use_pymupdf: bool) -> Optional[str]:
+        """Extract the text of a single page with the selected backend."""
+        page = pages[index]
+        return page.get_text("text") if use_pymupdf else page.extract_text()
+    
+    def _extract_pages_pymupdf(self, file_path: Path) -> List[str]:
+        """Extract the text of every page with MuPDF."""
+        with pymupdf.open(file_path) as pdf:
+            return [page.get_text("text") for page in pdf]
+    
+    def _extract_pages_pdfplumber(self, file_path: Path) -> List[str]:
+        """Extract the text of every page with pdfplumber."""
+        with _open_pdfplumber(file_path) as pdf:
+            return [page.extract_text() for page in pdf.pages]
+    
+    async def _extract_text_from_word(self, file_path: Path) -> List[str]:
+        """Extract text from Word document."""
+        try:
+            # python-docx parsing is blocking; keep it off the event loop
+            return await asyncio.to_thread(self._extract_word_sync, file_path)
             
         except Exception as e:
             logger.error(f"Word document text extraction failed: {e}")
             raise Exception(f"Failed to extract text from Word document: {str(e)}")
     
+    def _extract_word_sync(self, file_path: Path) -> List[str]:
+        """Extract text lines from a Word document on the calling thread."""
+        lines = []
+        
+        # Load the document
+        doc = Document(str(file_path))
+        
+        # Extract text from paragraphs
+        for paragraph in doc.paragraphs:
+            text = paragraph.text.strip()
+            if text:
+                lines.append(text)
+        
+        # Extract text from tables; a merged cell is returned once per grid
+        # position it spans, so skip cells whose underlying <w:tc> was already read
+        seen_cells = set()
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    if cell._tc in seen_cells:
+                        continue
+                    seen_cells.add(cell._tc)
+                    text = cell.text.strip()
+                    if text:
+                        lines.append(text)
+        
+        if not lines:
+            raise ValueError("No text content found in Word document")
+        
+        logger.info(f"Extracted {len(lines)} lines from Word document")
+        return lines
+    
     def validate_file(self, file_path: Path, max_size: int) -> bool:
         """
         Validate file format and size.
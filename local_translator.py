@@ -9,479 +9,601 @@ import asyncio
 from typing import List, Tuple, Dict
 import json
 import os
+import re
+import sys
+from functools import cache, lru_cache
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:
+    # بدونها تُفهرس العبارات بأول حرفين (أبطأ قليلاً لكن بلا اعتماديات إضافية)
+    ahocorasick = None
+
+# orjson أسرع بكثير في قراءة وكتابة القاموس؛ json القياسية هي البديل
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# الكلمة: أطول تتابع بلا مسافات ولا علامات الترقيم التي كانت تُزال من طرفيها
+_WORD_RE = re.compile(r'([^\s.,!?;:"()\[\]{}]+)')
+
+# نص بلا أي حرف لاتيني (عربي، أرقام، رموز) لا يطابق أي مفتاح إنجليزي في القاموس
+_ASCII_LETTER_RE = re.compile(r'[A-Za-z]')
+
+# كشف الرموز الرياضية: كل الأنماط في تعبير واحد مُجمّع مسبقاً
+_MATH_DETECT_RE = re.compile('|'.join((
+    r'\$.*?\$',  # LaTeX math
+    r'\\[a-zA-Z]+',  # LaTeX commands
+    r'[=∫∑∏∆∇±≤≥≠∞∪∩⊂⊃∈∉∀∃]',  # رموز رياضية
+    r'\b\d+[+\-*/=]\d+',  # معادلات أساسية
+    r'[xyz]\s*[=+\-*/]\s*\d+',  # متغيرات مع عمليات
+    r'\b(?:sin|cos|tan|log|ln|exp|sqrt)\(',  # دوال رياضية
+)))
+
+# أنماط الرموز الرياضية التي تُستبدل بعلامات مؤقتة قبل الترجمة (بالترتيب)
+_MATH_EXTRACT_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\$[^$]+\$',  # LATEX_MATH
+    r'\$\$[^$]+\$\$',  # LATEX_BLOCK
+    r'\\[a-zA-Z]+\{[^}]*\}',  # LATEX_CMD
+    r'\b\d+\s*[+\-*/=×÷]\s*\d+(?:\s*[+\-*/=×÷]\s*\d+)*',  # EQUATION
+    r'[xyz]\s*[=+\-*/]\s*[\d\w\s+\-*/]+',  # ALGEBRA
+))
+
+# قاموس الكلمات الأساسي المدمج، يُبنى مرة واحدة عند الاستيراد
+_BASE_DICTIONARY = {
+    "hello": "مرحباً",
+    "world": "عالم",
+    "the": "الـ",
+    "and": "و",
+    "or": "أو",
+    "in": "في",
+    "on": "على",
+    "at": "عند",
+    "to": "إلى",
+    "from": "من",
+    "with": "مع",
+    "by": "بواسطة",
+    "for": "لـ",
+    "of": "من",
+    "is": "هو/هي",
+    "are": "هم/هن",
+    "was": "كان",
+    "were": "كانوا",
+    "be": "يكون",
+    "been": "كان",
+    "have": "لديه",
+    "has": "لديه",
+    "had": "كان لديه",
+    "do": "يفعل",
+    "does": "يفعل",
+    "did": "فعل",
+    "will": "سوف",
+    "would": "سوف",
+    "could": "يمكن",
+    "should": "يجب",
+    "may": "قد",
+    "might": "ربما",
+    "can": "يمكن",
+    "must": "يجب",
+    "not": "لا",
+    "no": "لا",
+    "yes": "نعم",
+    "this": "هذا/هذه",
+    "that": "ذلك/تلك",
+    "these": "هؤلاء",
+    "those": "أولئك",
+    "what": "ماذا",
+    "when": "متى",
+    "where": "أين",
+    "why": "لماذا",
+    "how": "كيف",
+    "who": "من",
+    "which": "أي",
+    "all": "جميع",
+    "some": "بعض",
+    "any": "أي",
+    "many": "كثير",
+    "much": "كثير",
+    "few": "قليل",
+    "little": "قليل",
+    "more": "أكثر",
+    "most": "معظم",
+    "less": "أقل",
+    "least": "الأقل",
+    "good": "جيد",
+    "better": "أفضل",
+    "best": "الأفضل",
+    "bad": "سيء",
+    "worse": "أسوأ",
+    "worst": "الأسوأ",
+    "big": "كبير",
+    "small": "صغير",
+    "large": "كبير",
+    "new": "جديد",
+    "old": "قديم",
+    "young": "شاب",
+    "high": "عالي",
+    "low": "منخفض",
+    "long": "طويل",
+    "short": "قصير",
+    "wide": "واسع",
+    "narrow": "ضيق",
+    "thick": "سميك",
+    "thin": "رفيع",
+    "heavy": "ثقيل",
+    "light": "خفيف",
+    "hard": "صعب",
+    "easy": "سهل",
+    "difficult": "صعب",
+    "simple": "بسيط",
+    "complex": "معقد",
+    "important": "مهم",
+    "necessary": "ضروري",
+    "possible": "ممكن",
+    "impossible": "مستحيل",
+    "true": "صحيح",
+    "false": "خاطئ",
+    "right": "صحيح",
+    "wrong": "خاطئ",
+    "correct": "صحيح",
+    "incorrect": "غير صحيح",
+    "same": "نفس",
+    "different": "مختلف",
+    "similar": "مشابه",
+    "other": "آخر",
+    "another": "آخر",
+    "first": "أول",
+    "last": "آخر",
+    "next": "التالي",
+    "previous": "السابق",
+    "before": "قبل",
+    "after": "بعد",
+    "now": "الآن",
+    "then": "ثم",
+    "here": "هنا",
+    "there": "هناك",
+    "everywhere": "في كل مكان",
+    "nowhere": "لا مكان",
+    "somewhere": "مكان ما",
+    "today": "اليوم",
+    "tomorrow": "غداً",
+    "yesterday": "أمس",
+    "week": "أسبوع",
+    "month": "شهر",
+    "year": "سنة",
+    "day": "يوم",
+    "night": "ليلة",
+    "morning": "صباح",
+    "afternoon": "بعد الظهر",
+    "evening": "مساء",
+    "time": "وقت",
+    "hour": "ساعة",
+    "minute": "دقيقة",
+    "second": "ثانية",
+    "man": "رجل",
+    "woman": "امرأة",
+    "people": "الناس",
+    "person": "شخص",
+    "child": "طفل",
+    "children": "أطفال",
+    "family": "عائلة",
+    "friend": "صديق",
+    "work": "عمل",
+    "job": "وظيفة",
+    "business": "عمل تجاري",
+    "company": "شركة",
+    "money": "مال",
+    "price": "سعر",
+    "cost": "تكلفة",
+    "buy": "يشتري",
+    "sell": "يبيع",
+    "pay": "يدفع",
+    "give": "يعطي",
+    "take": "يأخذ",
+    "get": "يحصل على",
+    "put": "يضع",
+    "go": "يذهب",
+    "come": "يأتي",
+    "see": "يرى",
+    "look": "ينظر",
+    "watch": "يشاهد",
+    "hear": "يسمع",
+    "listen": "يستمع",
+    "speak": "يتحدث",
+    "talk": "يتكلم",
+    "say": "يقول",
+    "tell": "يخبر",
+    "ask": "يسأل",
+    "answer": "يجيب",
+    "read": "يقرأ",
+    "write": "يكتب",
+    "learn": "يتعلم",
+    "teach": "يعلم",
+    "study": "يدرس",
+    "know": "يعرف",
+    "understand": "يفهم",
+    "think": "يفكر",
+    "believe": "يؤمن",
+    "feel": "يشعر",
+    "want": "يريد",
+    "need": "يحتاج",
+    "like": "يحب",
+    "love": "يحب",
+    "hate": "يكره",
+    "hope": "يأمل",
+    "wish": "يتمنى",
+    "try": "يحاول",
+    "help": "يساعد",
+    "start": "يبدأ",
+    "stop": "يتوقف",
+    "end": "ينتهي",
+    "finish": "ينهي",
+    "continue": "يستمر",
+    "change": "يغير",
+    "turn": "يدير",
+    "move": "يتحرك",
+    "bring": "يجلب",
+    "carry": "يحمل",
+    "send": "يرسل",
+    "receive": "يستقبل",
+    "open": "يفتح",
+    "close": "يغلق",
+    "cut": "يقطع",
+    "break": "يكسر",
+    "fix": "يصلح",
+    "build": "يبني",
+    "make": "يصنع",
+    "create": "يخلق",
+    "destroy": "يدمر",
+    "kill": "يقتل",
+    "die": "يموت",
+    "live": "يعيش",
+    "eat": "يأكل",
+    "drink": "يشرب",
+    "sleep": "ينام",
+    "wake": "يستيقظ",
+    "walk": "يمشي",
+    "run": "يجري",
+    "drive": "يقود",
+    "fly": "يطير",
+    "swim": "يسبح",
+    "play": "يلعب",
+    "sing": "يغني",
+    "dance": "يرقص",
+    "laugh": "يضحك",
+    "cry": "يبكي",
+    "smile": "يبتسم",
+    "sit": "يجلس",
+    "stand": "يقف",
+    "lie": "يكذب",
+    "wait": "ينتظر",
+    "stay": "يبقى",
+    "leave": "يغادر",
+    "arrive": "يصل",
+    "enter": "يدخل",
+    "exit": "يخرج",
+    "return": "يعود",
+    "visit": "يزور",
+    "meet": "يقابل",
+    "join": "ينضم",
+    "follow": "يتبع",
+    "lead": "يقود",
+    "win": "يفوز",
+    "lose": "يخسر",
+    "find": "يجد",
+    "lose": "يفقد",
+    "keep": "يحتفظ",
+    "hold": "يمسك",
+    "catch": "يمسك",
+    "throw": "يرمي",
+    "push": "يدفع",
+    "pull": "يسحب",
+    "lift": "يرفع",
+    "drop": "يسقط",
+    "wear": "يلبس",
+    "remove": "يزيل",
+    "wash": "يغسل",
+    "clean": "ينظف",
+    "cook": "يطبخ",
+    "serve": "يقدم",
+    "order": "يطلب",
+    "choose": "يختار",
+    "decide": "يقرر",
+    "agree": "يوافق",
+    "disagree": "يختلف",
+    "accept": "يقبل",
+    "refuse": "يرفض",
+    "allow": "يسمح",
+    "forbid": "يمنع",
+    "permit": "يسمح",
+    "deny": "ينكر",
+    "admit": "يعترف",
+    "confirm": "يؤكد",
+    "cancel": "يلغي",
+    "book": "يحجز",
+    "reserve": "يحجز",
+    "plan": "يخطط",
+    "prepare": "يحضر",
+    "organize": "ينظم",
+    "arrange": "يرتب",
+    "manage": "يدير",
+    "control": "يتحكم",
+    "operate": "يشغل",
+    "use": "يستخدم",
+    "apply": "يطبق",
+    "employ": "يوظف",
+    "hire": "يوظف",
+    "fire": "يطرد",
+    "quit": "يستقيل",
+    "retire": "يتقاعد",
+    "graduate": "يتخرج",
+    "marry": "يتزوج",
+    "divorce": "يطلق"
+}
+
+# عبارات شائعة
+_BASE_PHRASES = {
+    "how are you": "كيف حالك",
+    "thank you": "شكراً لك",
+    "you're welcome": "عفواً",
+    "excuse me": "عذراً",
+    "i'm sorry": "أنا آسف",
+    "good morning": "صباح الخير",
+    "good evening": "مساء الخير",
+    "good night": "تصبح على خير",
+    "see you later": "أراك لاحقاً",
+    "nice to meet you": "سعيد بلقائك",
+    "what's your name": "ما اسمك",
+    "my name is": "اسمي",
+    "where are you from": "من أين أنت",
+    "i am from": "أنا من",
+    "how old are you": "كم عمرك",
+    "i am": "أنا",
+    "you are": "أنت",
+    "he is": "هو",
+    "she is": "هي",
+    "we are": "نحن",
+    "they are": "هم",
+    "what time is it": "كم الساعة",
+    "it is": "إنه",
+    "where is": "أين",
+    "here is": "هنا",
+    "there is": "هناك",
+    "how much": "كم",
+    "how many": "كم عدد",
+    "i want": "أريد",
+    "i need": "أحتاج",
+    "i like": "أحب",
+    "i don't like": "لا أحب",
+    "i love": "أحب",
+    "i hate": "أكره",
+    "i think": "أعتقد",
+    "i believe": "أؤمن",
+    "i know": "أعرف",
+    "i don't know": "لا أعرف",
+    "i understand": "أفهم",
+    "i don't understand": "لا أفهم",
+    "please": "من فضلك",
+    "can you": "هل يمكنك",
+    "could you": "هل يمكنك",
+    "would you": "هل تريد",
+    "will you": "هل ستقوم",
+    "let's go": "هيا بنا",
+    "let me": "دعني",
+    "wait for me": "انتظرني",
+    "come here": "تعال هنا",
+    "go there": "اذهب هناك",
+    "sit down": "اجلس",
+    "stand up": "قف",
+    "turn on": "شغل",
+    "turn off": "أطفئ",
+    "open the door": "افتح الباب",
+    "close the window": "أغلق النافذة",
+    "turn left": "انعطف يساراً",
+    "turn right": "انعطف يميناً",
+    "go straight": "امش مستقيماً",
+    "stop here": "توقف هنا",
+    "be careful": "كن حذراً",
+    "take care": "اعتن بنفسك",
+    "good luck": "حظاً سعيداً",
+    "congratulations": "مبروك",
+    "happy birthday": "عيد ميلاد سعيد",
+    "merry christmas": "عيد ميلاد مجيد",
+    "happy new year": "سنة جديدة سعيدة"
+}
+
+# عدد الأسطر المترجمة المحفوظة في الذاكرة المؤقتة (الترويسات والتذييلات تتكرر كثيراً)
+TRANSLATION_CACHE_SIZE = 20000
+
+def _json_loads(data: bytes) -> dict:
+    """قراءة JSON من بايتات UTF-8"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: dict) -> bytes:
+    """كتابة JSON بمسافة بادئة 2 وبأحرف عربية غير مهربة، كبايتات UTF-8"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _intern_items(entries: Dict[str, str]) -> Dict[str, str]:
+    """نسخة من القاموس بمفاتيح وقيم موحدة عبر sys.intern"""
+    return {sys.intern(english): sys.intern(arabic) for english, arabic in entries.items()}
+
+
 class LocalTranslator:
     """مترجم محلي احتياطي باستخدام قاموس مدمج"""
     
     def __init__(self):
         self.dictionary = {}
         self.phrase_dictionary = {}
+        self._phrase_automaton = None
+        self._phrase_by_prefix = {}
+        self._ascii_keys_only = False
         self.load_local_dictionary()
         
+        # ذاكرة مؤقتة خاصة بكل مثيل، تُفرغ عند تعديل القاموس
+        self._translate_cached = lru_cache(maxsize=TRANSLATION_CACHE_SIZE)(self._translate_sync)
+        
     def load_local_dictionary(self):
         """تحميل القاموس المحلي من ملف JSON"""
         try:
-            # قاموس أساسي مدمج
-            self.dictionary = {
-                "hello": "مرحباً",
-                "world": "عالم",
-                "the": "الـ",
-                "and": "و",
-                "or": "أو",
-                "in": "في",
-                "on": "على",
-                "at": "عند",
-                "to": "إلى",
-                "from": "من",
-                "with": "مع",
-                "by": "بواسطة",
-                "for": "لـ",
-                "of": "من",
-                "is": "هو/هي",
-                "are": "هم/هن",
-                "was": "كان",
-                "were": "كانوا",
-                "be": "يكون",
-                "been": "كان",
-                "have": "لديه",
-                "has": "لديه",
-                "had": "كان لديه",
-                "do": "يفعل",
-                "does": "يفعل",
-                "did": "فعل",
-                "will": "سوف",
-                "would": "سوف",
-                "could": "يمكن",
-                "should": "يجب",
-                "may": "قد",
-                "might": "ربما",
-                "can": "يمكن",
-                "must": "يجب",
-                "not": "لا",
-                "no": "لا",
-                "yes": "نعم",
-                "this": "هذا/هذه",
-                "that": "ذلك/تلك",
-                "these": "هؤلاء",
-                "those": "أولئك",
-                "what": "ماذا",
-                "when": "متى",
-                "where": "أين",
-                "why": "لماذا",
-                "how": "كيف",
-                "who": "من",
-                "which": "أي",
-                "all": "جميع",
-                "some": "بعض",
-                "any": "أي",
-                "many": "كثير",
-                "much": "كثير",
-                "few": "قليل",
-                "little": "قليل",
-                "more": "أكثر",
-                "most": "معظم",
-                "less": "أقل",
-                "least": "الأقل",
-                "good": "جيد",
-                "better": "أفضل",
-                "best": "الأفضل",
-                "bad": "سيء",
-                "worse": "أسوأ",
-                "worst": "الأسوأ",
-                "big": "كبير",
-                "small": "صغير",
-                "large": "كبير",
-                "new": "جديد",
-                "old": "قديم",
-                "young": "شاب",
-                "high": "عالي",
-                "low": "منخفض",
-                "long": "طويل",
-                "short": "قصير",
-                "wide": "واسع",
-                "narrow": "ضيق",
-                "thick": "سميك",
-                "thin": "رفيع",
-                "heavy": "ثقيل",
-                "light": "خفيف",
-                "hard": "صعب",
-                "easy": "سهل",
-                "difficult": "صعب",
-                "simple": "بسيط",
-                "complex": "معقد",
-                "important": "مهم",
-                "necessary": "ضروري",
-                "possible": "ممكن",
-                "impossible": "مستحيل",
-                "true": "صحيح",
-                "false": "خاطئ",
-                "right": "صحيح",
-                "wrong": "خاطئ",
-                "correct": "صحيح",
-                "incorrect": "غير صحيح",
-                "same": "نفس",
-                "different": "مختلف",
-                "similar": "مشابه",
-                "other": "آخر",
-                "another": "آخر",
-                "first": "أول",
-                "last": "آخر",
-                "next": "التالي",
-                "previous": "السابق",
-                "before": "قبل",
-                "after": "بعد",
-                "now": "الآن",
-                "then": "ثم",
-                "here": "هنا",
-                "there": "هناك",
-                "everywhere": "في كل مكان",
-                "nowhere": "لا مكان",
-                "somewhere": "مكان ما",
-                "today": "اليوم",
-                "tomorrow": "غداً",
-                "yesterday": "أمس",
-                "week": "أسبوع",
-                "month": "شهر",
-                "year": "سنة",
-                "day": "يوم",
-                "night": "ليلة",
-                "morning": "صباح",
-                "afternoon": "بعد الظهر",
-                "evening": "مساء",
-                "time": "وقت",
-                "hour": "ساعة",
-                "minute": "دقيقة",
-                "second": "ثانية",
-                "man": "رجل",
-                "woman": "امرأة",
-                "people": "الناس",
-                "person": "شخص",
-                "child": "طفل",
-                "children": "أطفال",
-                "family": "عائلة",
-                "friend": "صديق",
-                "work": "عمل",
-                "job": "وظيفة",
-                "business": "عمل تجاري",
-                "company": "شركة",
-                "money": "مال",
-                "price": "سعر",
-                "cost": "تكلفة",
-                "buy": "يشتري",
-                "sell": "يبيع",
-                "pay": "يدفع",
-                "give": "يعطي",
-                "take": "يأخذ",
-                "get": "يحصل على",
-                "put": "يضع",
-                "go": "يذهب",
-                "come": "يأتي",
-                "see": "يرى",
-                "look": "ينظر",
-                "watch": "يشاهد",
-                "hear": "يسمع",
-                "listen": "يستمع",
-                "speak": "يتحدث",
-                "talk": "يتكلم",
-                "say": "يقول",
-                "tell": "يخبر",
-                "ask": "يسأل",
-                "answer": "يجيب",
-                "read": "يقرأ",
-                "write": "يكتب",
-                "learn": "يتعلم",
-                "teach": "يعلم",
-                "study": "يدرس",
-                "know": "يعرف",
-                "understand": "يفهم",
-                "think": "يفكر",
-                "believe": "يؤمن",
-                "feel": "يشعر",
-                "want": "يريد",
-                "need": "يحتاج",
-                "like": "يحب",
-                "love": "يحب",
-                "hate": "يكره",
-                "hope": "يأمل",
-                "wish": "يتمنى",
-                "try": "يحاول",
-                "help": "يساعد",
-                "start": "يبدأ",
-                "stop": "يتوقف",
-                "end": "ينتهي",
-                "finish": "ينهي",
-                "continue": "يستمر",
-                "change": "يغير",
-                "turn": "يدير",
-                "move": "يتحرك",
-                "bring": "يجلب",
-                "carry": "يحمل",
-                "send": "يرسل",
-                "receive": "يستقبل",
-                "open": "يفتح",
-                "close": "يغلق",
-                "cut": "يقطع",
-                "break": "يكسر",
-                "fix": "يصلح",
-                "build": "يبني",
-                "make": "يصنع",
-                "create": "يخلق",
-                "destroy": "يدمر",
-                "kill": "يقتل",
-                "die": "يموت",
-                "live": "يعيش",
-                "eat": "يأكل",
-                "drink": "يشرب",
-                "sleep": "ينام",
-                "wake": "يستيقظ",
-                "walk": "يمشي",
-                "run": "يجري",
-                "drive": "يقود",
-                "fly": "يطير",
-                "swim": "يسبح",
-                "play": "يلعب",
-                "sing": "يغني",
-                "dance": "يرقص",
-                "laugh": "يضحك",
-                "cry": "يبكي",
-                "smile": "يبتسم",
-                "sit": "يجلس",
-                "stand": "يقف",
-                "lie": "يكذب",
-                "wait": "ينتظر",
-                "stay": "يبقى",
-                "leave": "يغادر",
-                "arrive": "يصل",
-                "enter": "يدخل",
-                "exit": "يخرج",
-                "return": "يعود",
-                "visit": "يزور",
-                "meet": "يقابل",
-                "join": "ينضم",
-                "follow": "يتبع",
-                "lead": "يقود",
-                "win": "يفوز",
-                "lose": "يخسر",
-                "find": "يجد",
-                "lose": "يفقد",
-                "keep": "يحتفظ",
-                "hold": "يمسك",
-                "catch": "يمسك",
-                "throw": "يرمي",
-                "push": "يدفع",
-                "pull": "يسحب",
-                "lift": "يرفع",
-                "drop": "يسقط",
-                "wear": "يلبس",
-                "remove": "يزيل",
-                "wash": "يغسل",
-                "clean": "ينظف",
-                "cook": "يطبخ",
-                "serve": "يقدم",
-                "order": "يطلب",
-                "choose": "يختار",
-                "decide": "يقرر",
-                "agree": "يوافق",
-                "disagree": "يختلف",
-                "accept": "يقبل",
-                "refuse": "يرفض",
-                "allow": "يسمح",
-                "forbid": "يمنع",
-                "permit": "يسمح",
-                "deny": "ينكر",
-                "admit": "يعترف",
-                "confirm": "يؤكد",
-                "cancel": "يلغي",
-                "book": "يحجز",
-                "reserve": "يحجز",
-                "plan": "يخطط",
-                "prepare": "يحضر",
-                "organize": "ينظم",
-                "arrange": "يرتب",
-                "manage": "يدير",
-                "control": "يتحكم",
-                "operate": "يشغل",
-                "use": "يستخدم",
-                "apply": "يطبق",
-                "employ": "يوظف",
-                "hire": "يوظف",
-                "fire": "يطرد",
-                "quit": "يستقيل",
-                "retire": "يتقاعد",
-                "graduate": "يتخرج",
-                "marry": "يتزوج",
-                "divorce": "يطلق"
-            }
+            # قاموس أساسي مدمج (نسخة لأن add_translation يعدّل القاموس)
+            self.dictionary = dict(_BASE_DICTIONARY)
             
             # عبارات شائعة
-            self.phrase_dictionary = {
-                "how are you": "كيف حالك",
-                "thank you": "شكراً لك",
-                "you're welcome": "عفواً",
-                "excuse me": "عذراً",
-                "i'm sorry": "أنا آسف",
-                "good morning": "صباح الخير",
-                "good evening": "مساء الخير",
-                "good night": "تصبح على خير",
-                "see you later": "أراك لاحقاً",
-                "nice to meet you": "سعيد بلقائك",
-                "what's your name": "ما اسمك",
-                "my name is": "اسمي",
-                "where are you from": "من أين أنت",
-                "i am from": "أنا من",
-                "how old are you": "كم عمرك",
-                "i am": "أنا",
-                "you are": "أنت",
-                "he is": "هو",
-                "she is": "هي",
-                "we are": "نحن",
-                "they are": "هم",
-                "what time is it": "كم الساعة",
-                "it is": "إنه",
-                "where is": "أين",
-                "here is": "هنا",
-                "there is": "هناك",
-                "how much": "كم",
-                "how many": "كم عدد",
-                "i want": "أريد",
-                "i need": "أحتاج",
-                "i like": "أحب",
-                "i don't like": "لا أحب",
-                "i love": "أحب",
-                "i hate": "أكره",
-                "i think": "أعتقد",
-                "i believe": "أؤمن",
-                "i know": "أعرف",
-                "i don't know": "لا أعرف",
-                "i understand": "أفهم",
-                "i don't understand": "لا أفهم",
-                "please": "من فضلك",
-                "can you": "هل يمكنك",
-                "could you": "هل يمكنك",
-                "would you": "هل تريد",
-                "will you": "هل ستقوم",
-                "let's go": "هيا بنا",
-                "let me": "دعني",
-                "wait for me": "انتظرني",
-                "come here": "تعال هنا",
-                "go there": "اذهب هناك",
-                "sit down": "اجلس",
-                "stand up": "قف",
-                "turn on": "شغل",
-                "turn off": "أطفئ",
-                "open the door": "افتح الباب",
-                "close the window": "أغلق النافذة",
-                "turn left": "انعطف يساراً",
-                "turn right": "انعطف يميناً",
-                "go straight": "امش مستقيماً",
-                "stop here": "توقف هنا",
-                "be careful": "كن حذراً",
-                "take care": "اعتن بنفسك",
-                "good luck": "حظاً سعيداً",
-                "congratulations": "مبروك",
-                "happy birthday": "عيد ميلاد سعيد",
-                "merry christmas": "عيد ميلاد مجيد",
-                "happy new year": "سنة جديدة سعيدة"
-            }
+            self.phrase_dictionary = dict(_BASE_PHRASES)
             
             # محاولة تحميل قاموس إضافي من ملف
             dictionary_file = Path("local_dictionary.json")
             if dictionary_file.exists():
-                with open(dictionary_file, 'r', encoding='utf-8') as f:
-                    additional_dict = json.load(f)
-                    self.dictionary.update(additional_dict.get('words', {}))
-                    self.phrase_dictionary.update(additional_dict.get('phrases', {}))
+                additional_dict = _json_loads(dictionary_file.read_bytes())
+                # توحيد النصوص المكررة (الترجمات العربية تتكرر كثيراً)؛ القاموس المدمج موحد أصلاً
+                self.dictionary.update(_intern_items(additional_dict.get('words', {})))
+                self.phrase_dictionary.update(_intern_items(additional_dict.get('phrases', {})))
                     
             logger.info(f"تم تحميل {len(self.dictionary)} كلمة و {len(self.phrase_dictionary)} عبارة في القاموس المحلي")
             
         except Exception as e:
             logger.warning(f"خطأ في تحميل القاموس المحلي: {e}")
+        
+        # المسار السريع في translate_text صحيح فقط إذا احتوى كل مفتاح على حرف لاتيني
+        self._ascii_keys_only = all(
+            _ASCII_LETTER_RE.search(key) for key in (*self.dictionary, *self.phrase_dictionary)
+        )
+        self._build_phrase_automaton()
     
-    async def translate_text(self, text: str) -> str:
+    def _build_phrase_automaton(self):
+        """بناء آلة Aho-Corasick لجميع العبارات لمسح النص في تمريرة واحدة"""
+        self._phrase_automaton = None
+        self._phrase_by_prefix = {}
+        if not self.phrase_dictionary:
+            return
+        
+        if ahocorasick is None:
+            self._build_phrase_buckets()
+            return
+        
+        automaton = ahocorasick.Automaton()
+        for phrase, translation in self.phrase_dictionary.items():
+            automaton.add_word(phrase, (len(phrase), translation))
+        automaton.make_automaton()
+        self._phrase_automaton = automaton
+    
+    def _build_phrase_buckets(self):
+        """فهرسة العبارات بأول حرفين (الأطول أولاً) عند غياب pyahocorasick"""
+        buckets = {}
+        phrases = sorted(self.phrase_dictionary.items(), key=lambda item: len(item[0]), reverse=True)
+        for phrase, translation in phrases:
+            if phrase:
+                buckets.setdefault(phrase[:2], []).append((phrase, translation))
+        self._phrase_by_prefix = buckets
+    
+    def _replace_phrases_by_prefix(self, lower_text: str) -> str:
+        """نفس استبدال _replace_phrases لكن يختبر فقط العبارات التي تبدأ بالحرفين الحاليين"""
+        buckets = self._phrase_by_prefix
+        parts = []
+        last_end = 0
+        i = 0
+        length = len(lower_text)
+        
+        while i < length:
+            # العبارة ذات الحرف الواحد مفتاحها حرف واحد؛ تُجرب بعد الحرفين
+            bucket = buckets.get(lower_text[i:i + 2]) or buckets.get(lower_text[i])
+            match = None
+            if bucket:
+                for phrase, translation in bucket:
+                    if lower_text.startswith(phrase, i):
+                        match = (phrase, translation)
+                        break
+            
+            if match is None:
+                i += 1
+                continue
+            
+            phrase, translation = match
+            parts.append(lower_text[last_end:i])
+            parts.append(translation)
+            i += len(phrase)
+            last_end = i
+        
+        if not parts:
+            return lower_text
+        parts.append(lower_text[last_end:])
+        return "".join(parts)
+    
+    def _replace_phrases(self, lower_text: str) -> str:
+        """استبدال العبارات المعروفة بترجماتها في مسح خطي واحد (الأطول من اليسار أولاً)"""
+        if self._phrase_automaton is None:
+            if self._phrase_by_prefix:
+                return self._replace_phrases_by_prefix(lower_text)
+            return lower_text
+        
+        parts = []
+        last_end = 0
+        for end_index, (length, translation) in self._phrase_automaton.iter_long(lower_text):
+            start = end_index - length + 1
+            parts.append(lower_text[last_end:start])
+            parts.append(translation)
+            last_end = end_index + 1
+        
+        if not parts:
+            return lower_text
+        parts.append(lower_text[last_end:])
+        return "".join(parts)
+    
+    def translate_text(self, text: str) -> str:
         """ترجمة النص باستخدام القاموس المحلي مع الحفاظ على الرموز الرياضية"""
         if not text or not text.strip():
             return text
+        
+        # لا شيء يمكن ترجمته؛ تجنب المرور بالعبارات والكلمات (ومن ملء الذاكرة المؤقتة)
+        if self._ascii_keys_only and not _ASCII_LETTER_RE.search(text):
+            return text
             
         try:
-            # فحص وجود رموز رياضية
-            if self._contains_math(text):
-                return await self._translate_with_math_preservation(text)
-            
-            original_text = text.strip()
-            lower_text = original_text.lower()
-            
-            # البحث في عبارات كاملة أولاً
-            for phrase, translation in self.phrase_dictionary.items():
-                if phrase in lower_text:
-                    lower_text = lower_text.replace(phrase, translation)
-            
-            # ترجمة كلمة بكلمة
-            words = lower_text.split()
-            translated_words = []
-            
-            for word in words:
-                # إزالة علامات الترقيم
-                clean_word = word.strip('.,!?;:"()[]{}').lower()
-                
-                if clean_word in self.dictionary:
-                    # الاحتفاظ بعلامات الترقيم
-                    punctuation = word[len(clean_word):]
-                    translated_words.append(self.dictionary[clean_word] + punctuation)
-                else:
-                    # إذا لم توجد ترجمة، احتفظ بالكلمة الأصلية
-                    translated_words.append(word)
-            
-            return " ".join(translated_words)
+            return self._translate_cached(text)
             
         except Exception as e:
             logger.error(f"خطأ في الترجمة المحلية: {e}")
             return text
 
+    def _translate_sync(self, text: str) -> str:
+        """ترجمة النص (بدون await) - نتيجتها تعتمد على النص فقط فتُحفظ في الذاكرة المؤقتة"""
+        # فحص وجود رموز رياضية
+        if self._contains_math(text):
+            return self._translate_with_math_preservation(text)
+        
+        return self._translate_basic(text)
+
     def _contains_math(self, text: str) -> bool:
         """فحص وجود رموز رياضية في النص"""
-        import re
-        math_patterns = [
-            r'\$.*?\$',  # LaTeX math
-            r'\\[a-zA-Z]+',  # LaTeX commands
-            r'[=∫∑∏∆∇±≤≥≠∞∪∩⊂⊃∈∉∀∃]',  # رموز رياضية
-            r'\b\d+[+\-*/=]\d+',  # معادلات أساسية
-            r'[xyz]\s*[=+\-*/]\s*\d+',  # متغيرات مع عمليات
-            r'\b(sin|cos|tan|log|ln|exp|sqrt)\(',  # دوال رياضية
-        ]
-        
-        return any(re.search(pattern, text) for pattern in math_patterns)
+        return _MATH_DETECT_RE.search(text) is not None
 
-    async def _translate_with_math_preservation(self, text: str) -> str:
+    def _translate_with_math_preservation(self, text: str) -> str:
         """ترجمة النص مع الحفاظ على الرموز الرياضية"""
-        import re
-        
         # استخراج الرموز الرياضية
         math_expressions = {}
         modified_text = text
         placeholder_counter = 0
         
-        # أنماط الرموز الرياضية
-        patterns = [
-            (r'\$[^$]+\$', 'LATEX_MATH'),
-            (r'\$\$[^$]+\$\$', 'LATEX_BLOCK'),
-            (r'\\[a-zA-Z]+\{[^}]*\}', 'LATEX_CMD'),
-            (r'\b\d+\s*[+\-*/=×÷]\s*\d+(?:\s*[+\-*/=×÷]\s*\d+)*', 'EQUATION'),
-            (r'[xyz]\s*[=+\-*/]\s*[\d\w\s+\-*/]+', 'ALGEBRA'),
-        ]
-        
-        for pattern, expr_type in patterns:
-            matches = re.finditer(pattern, modified_text)
-            for match in matches:
-                placeholder = f"__MATH_EXPR_{placeholder_counter}__"
+        for pattern in _MATH_EXTRACT_PATTERNS:
+            for match in pattern.finditer(modified_text):
+                # بأحرف صغيرة لأن الترجمة الأساسية تحوّل النص إلى أحرف صغيرة
+                placeholder = f"__math_expr_{placeholder_counter}__"
                 math_expressions[placeholder] = match.group()
                 modified_text = modified_text.replace(match.group(), placeholder, 1)
                 placeholder_counter += 1
         
         # ترجمة النص بدون الرموز الرياضية
-        translated_text = await self.translate_text_basic(modified_text)
+        translated_text = self._translate_basic(modified_text)
         
         # إعادة الرموز الرياضية
         for placeholder, original_expr in math_expressions.items():
@@ -489,53 +611,49 @@ class LocalTranslator:
         
         return translated_text
 
-    async def translate_text_basic(self, text: str) -> str:
+    def translate_text_basic(self, text: str) -> str:
         """ترجمة النص الأساسية بدون رموز رياضية"""
+        return self._translate_basic(text)
+    
+    def _translate_basic(self, text: str) -> str:
+        """ترجمة النص الأساسية بدون رموز رياضية (عبارات ثم كلمة بكلمة)"""
         original_text = text.strip()
         lower_text = original_text.lower()
         
         # البحث في عبارات كاملة أولاً
-        for phrase, translation in self.phrase_dictionary.items():
-            if phrase in lower_text:
-                lower_text = lower_text.replace(phrase, translation)
+        lower_text = self._replace_phrases(lower_text)
         
-        # ترجمة كلمة بكلمة
-        words = lower_text.split()
-        translated_words = []
+        # توحيد المسافات كما في التقسيم كلمة بكلمة
+        lower_text = " ".join(lower_text.split())
         
-        for word in words:
-            # إزالة علامات الترقيم
-            clean_word = word.strip('.,!?;:"()[]{}').lower()
-            
-            if clean_word in self.dictionary:
-                # الاحتفاظ بعلامات الترقيم
-                punctuation = word[len(clean_word):]
-                translated_words.append(self.dictionary[clean_word] + punctuation)
-            else:
-                # إذا لم توجد ترجمة، احتفظ بالكلمة الأصلية
-                translated_words.append(word)
-        
-        return " ".join(translated_words)
+        # ترجمة كلمة بكلمة: تقسيم واحد بالـ regex يضع الكلمات في المواضع الفردية
+        # وعلامات الترقيم حولها تبقى مكانها، وإذا لم توجد ترجمة تبقى الكلمة الأصلية
+        parts = _WORD_RE.split(lower_text)
+        lookup = self.dictionary.get
+        parts[1::2] = [lookup(word, word) for word in parts[1::2]]
+        return "".join(parts)
     
-    async def translate_lines(self, lines: List[str]) -> List[Tuple[str, str]]:
-        """ترجمة عدة أسطر باستخدام القاموس المحلي"""
-        translated_pairs = []
-        
-        for line in lines:
-            if line.strip():
-                translated = await self.translate_text(line)
-                translated_pairs.append((line, translated))
-            else:
-                translated_pairs.append((line, ""))
-        
-        return translated_pairs
+    def translate_lines(self, lines: List[str]) -> List[Tuple[str, str]]:
+        """ترجمة عدة أسطر باستخدام القاموس المحلي (عمل حسابي بحت؛ المستدعي غير المتزامن يمررها إلى asyncio.to_thread)"""
+        # تمريرة واحدة على الدفعة عبر الذاكرة المؤقتة
+        translate = self.translate_text
+        return [(line, translate(line) if line.strip() else "") for line in lines]
     
     def add_translation(self, english: str, arabic: str, is_phrase: bool = False):
         """إضافة ترجمة جديدة للقاموس"""
+        english = sys.intern(english.lower())
+        arabic = sys.intern(arabic)
+        if not _ASCII_LETTER_RE.search(english):
+            self._ascii_keys_only = False
+        
         if is_phrase:
-            self.phrase_dictionary[english.lower()] = arabic
+            self.phrase_dictionary[english] = arabic
+            self._build_phrase_automaton()
         else:
-            self.dictionary[english.lower()] = arabic
+            self.dictionary[english] = arabic
+        
+        # الترجمات المحفوظة قد لا تكون صحيحة بعد الآن
+        self._translate_cached.cache_clear()
     
     def save_dictionary(self):
         """حفظ القاموس في ملف"""
@@ -545,13 +663,14 @@ class LocalTranslator:
                 'phrases': self.phrase_dictionary
             }
             
-            with open("local_dictionary.json", 'w', encoding='utf-8') as f:
-                json.dump(dictionary_data, f, ensure_ascii=False, indent=2)
+            Path("local_dictionary.json").write_bytes(_json_dumps(dictionary_data))
                 
             logger.info("تم حفظ القاموس المحلي")
             
         except Exception as e:
             logger.error(f"خطأ في حفظ القاموس: {e}")
 
-# إنشاء مثيل عام
-local_translator = LocalTranslator()
+@cache
+def get_local_translator() -> LocalTranslator:
+    """المثيل العام، يُنشأ عند أول استخدام لا عند استيراد الوحدة"""
+    return LocalTranslator()
@@ -7,9 +7,11 @@ Main entry point for the bot application.
 import asyncio
 import logging
 import os
+import random
 import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from telegram.ext import Application
 from telegram.error import Conflict
 from telegram import Bot
@@ -34,15 +36,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global variable to track the application
-application = None
+# Bot restart backoff: the delay doubles per failed attempt up to the cap, with jitter
+RESTART_BASE_DELAY = 15
+RESTART_MAX_DELAY = 240
+
+
+def _restart_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, so repeated restarts don't hit Telegram in lockstep."""
+    return min(RESTART_MAX_DELAY, RESTART_BASE_DELAY * 2 ** (attempt - 1)) * (0.5 + random.random())
+
+class _ReuseTCPServer(socketserver.TCPServer):
+    """TCP server that can rebind the port while old sockets sit in TIME_WAIT."""
+    allow_reuse_address = True
 
 # Add this for Render port binding
 def start_health_server():
     """Start a simple HTTP server for health checks on Render"""
     port = int(os.environ.get('PORT', 8080))
     
-    class HealthHandler(http.server.SimpleHTTPRequestHandler):
+    # BaseHTTPRequestHandler: no filesystem work, just the health route
+    class HealthHandler(http.server.BaseHTTPRequestHandler):
         def do_GET(self):
             if self.path == '/health':
                 self.send_response(200)
@@ -54,38 +67,12 @@ def start_health_server():
                 self.end_headers()
     
     try:
-        httpd = socketserver.TCPServer(("", port), HealthHandler)
+        httpd = _ReuseTCPServer(("", port), HealthHandler)
         logger.info(f"Health check server started on port {port}")
         httpd.serve_forever()
     except Exception as e:
         logger.error(f"Failed to start health check server: {e}")
 
-def signal_handler(sig, frame):
-    """Handle shutdown signals gracefully."""
-    logger.info("Received shutdown signal, stopping bot...")
-    if application:
-        # Create a new event loop for shutdown if needed
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(shutdown_application())
-            else:
-                loop.run_until_complete(shutdown_application())
-        except Exception as e:
-            logger.error(f"Error during shutdown: {e}")
-    sys.exit(0)
-
-async def shutdown_application():
-    """Shutdown the application gracefully."""
-    global application
-    if application:
-        try:
-            await application.stop()
-            await application.shutdown()
-            logger.info("Bot stopped successfully")
-        except Exception as e:
-            logger.error(f"Error shutting down application: {e}")
-
 async def cleanup_webhook(bot_token):
     """Clean up any existing webhook to prevent conflicts."""
     try:
@@ -99,7 +86,7 @@ async def cleanup_webhook(bot_token):
 
 async def main():
     """Main function to start the bot."""
-    global application
+    application = None
     
     try:
         # Initialize configuration
@@ -118,6 +105,12 @@ async def main():
         # Wait a bit to ensure cleanup is complete
         await asyncio.sleep(2)
 
+        # asyncio.to_thread work (SDK calls, document builds) runs on the default executor;
+        # size it to the configured translation concurrency, which also caps Gemini key admission
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=config.TRANSLATE_CONCURRENCY, thread_name_prefix="translate")
+        )
+
         # Initialize database
         await db_manager.initialize()
         logger.info("Database connection established")
@@ -126,11 +119,24 @@ async def main():
         application = Application.builder().token(config.TELEGRAM_BOT_TOKEN).build()
 
         # Register all handlers
-        register_handlers(application)
+        bot_handlers = register_handlers(application)
+
+        # Created on this run's event loop (run_bot makes a new loop per retry)
+        stop_event = asyncio.Event()
 
-        # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        def request_stop():
+            """Wake main(); its finally block stops the application and closes the database."""
+            logger.info("Received shutdown signal, stopping bot...")
+            stop_event.set()
+
+        # Set up signal handlers for graceful shutdown, run by the loop outside signal context
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, request_stop)
+            except NotImplementedError:
+                # Windows event loops have no signal handler support; Ctrl+C still raises KeyboardInterrupt
+                pass
 
         logger.info("Starting Telegram bot...")
 
@@ -146,9 +152,8 @@ async def main():
                 timeout=30  # Only use supported timeout parameter
             )
             
-            # Keep the bot running
-            while True:
-                await asyncio.sleep(1)
+            # Keep the bot running until a shutdown signal sets the event
+            await stop_event.wait()
                 
         except Conflict as e:
             logger.error(f"Conflict error: {e}")
@@ -179,6 +184,7 @@ async def main():
                 if application:
                     await application.stop()
                     await application.shutdown()
+                await bot_handlers.aclose()
                 await db_manager.close()
             except Exception as e:
                 logger.error(f"Error during cleanup: {e}")
@@ -192,12 +198,13 @@ def run_bot():
     max_retries = 5  # Increased retries
     retry_count = 0
     
+    # Start health check server in a separate thread for Render, once -
+    # it outlives bot restarts, so retries must not try to bind the port again
+    health_thread = threading.Thread(target=start_health_server, daemon=True)
+    health_thread.start()
+    
     while retry_count < max_retries:
         try:
-            # Start health check server in a separate thread for Render
-            health_thread = threading.Thread(target=start_health_server, daemon=True)
-            health_thread.start()
-            
             # Check if we're in a deployment environment
             if os.getenv("REPLIT_DEPLOYMENT"):
                 # Running in deployment mode
@@ -218,8 +225,9 @@ def run_bot():
                 retry_count += 1
                 logger.error(f"Bot attempt {retry_count} failed: {e}")
                 if retry_count < max_retries:
-                    logger.info(f"Retrying in 15 seconds... ({retry_count}/{max_retries})")
-                    time.sleep(15)  # Increased wait time
+                    delay = _restart_delay(retry_count)
+                    logger.info(f"Retrying in {delay:.0f} seconds... ({retry_count}/{max_retries})")
+                    time.sleep(delay)
                 else:
                     logger.error("Max retries reached. Exiting.")
                     sys.exit(1)
@@ -242,8 +250,9 @@ def run_bot():
             logger.error(f"Fatal error: {e}")
             retry_count += 1
             if retry_count < max_retries:
-                logger.info(f"Retrying in 15 seconds... ({retry_count}/{max_retries})")
-                time.sleep(15)  # Increased wait time
+                delay = _restart_delay(retry_count)
+                logger.info(f"Retrying in {delay:.0f} seconds... ({retry_count}/{max_retries})")
+                time.sleep(delay)
             else:
                 logger.error("Max retries reached. Exiting.")
                 sys.exit(1)
@@ -5,137 +5,416 @@ Multi-API Key Manager
 
 import logging
 import asyncio
-import random
+import contextvars
+import functools
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Callable
 import os
 import json
-from datetime import datetime, timedelta
-import google.generativeai as genai
-from groq import Groq
+import re
+import threading
+from datetime import datetime
+from google import genai
+from google.genai import types as genai_types
+import httpx
+from aiolimiter import AsyncLimiter
+from groq import AsyncGroq
+from config import Config
+from local_translator import get_local_translator
 
 logger = logging.getLogger(__name__)
 
+# نص التعليمات ثابت لكل الطلبات، فيُبنى مرة واحدة ويُلحق به النص فقط
+GROQ_TRANSLATION_PROMPT = (
+    "Translate the following English text to Arabic. "
+    "Return only the Arabic translation without any explanations:\n\n"
+)
+
+# حالات قاطع الدائرة لكل مفتاح: مغلق (يعمل)، مفتوح (في فترة تهدئة)، نصف مفتوح (طلب تجريبي واحد)
+KEY_CLOSED = "closed"
+KEY_OPEN = "open"
+KEY_HALF_OPEN = "half_open"
+
+# عدد الأخطاء العادية المتتالية قبل فتح الدائرة (أخطاء تجاوز الحصة تفتحها فوراً)
+KEY_FAILURE_THRESHOLD = 3
+
+# أولوية المفتاح السليم (الرقم الأصغر أولاً)؛ كل فشل عادي يخفضها درجة حتى ينجح المفتاح
+KEY_DEFAULT_PRIORITY = 1
+
+# أقصى مدة تهدئة للمفتاح بالثواني (المدة تتضاعف مع تكرار الفشل)
+KEY_MAX_OPEN_SECONDS = 300
+
+# مهلة الطلب التجريبي للمفتاح نصف المفتوح بالثواني؛ إذا لم تُبلَّغ نتيجته خلالها يُعطى لطلب تجريبي آخر
+KEY_PROBE_TIMEOUT = 60
+
+# حصة الطلبات في الدقيقة لكل مفتاح Gemini (حد الخطة المجانية افتراضياً)؛ تُستهلك مسبقاً بدلاً من انتظار 429
+KEY_REQUESTS_PER_MINUTE = int(os.getenv("KEY_REQUESTS_PER_MINUTE", "10"))
+
+# ملف حالة المفاتيح بين عمليات إعادة التشغيل (بصمات المفاتيح فقط، لا المفاتيح نفسها)
+KEY_STATE_FILE = os.getenv("KEY_STATE_FILE", "api_key_state.json")
+
+# علامات أخطاء تجاوز الحد/الحصة
+_QUOTA_RE = re.compile(r"429|RESOURCE_EXHAUSTED|quota|rate limit", re.IGNORECASE)
+
+@dataclass(slots=True)
+class KeyInfo:
+    """بيانات مفتاح API وحالة دائرته"""
+    # المفتاح لا يظهر في repr حتى لا يتسرب إلى السجلات
+    key: str = field(repr=False)
+    name: str
+    # الصيغة المقنّعة للعرض تُحسب مرة واحدة
+    masked: str = ""
+    priority: int = KEY_DEFAULT_PRIORITY
+    weight: int = 1
+    # عميل خاص بالمفتاح (لا حالة عامة مشتركة كما في genai.configure)؛ يُنشأ في get_client
+    client: Optional[genai.Client] = field(default=None, repr=False)
+    # دلو رموز خاص بالمفتاح يوزع طلباته على حصته في الدقيقة
+    limiter: Optional[AsyncLimiter] = field(default=None, repr=False)
+    usage_count: int = 0
+    # time.monotonic() عند آخر استخدام؛ يُحوَّل لوقت مقروء فقط في get_status
+    last_used: Optional[float] = None
+    state: str = KEY_CLOSED
+    failure_count: int = 0
+    open_until: float = 0.0
+
+async def _run_blocking(func: Callable, *args, **kwargs):
+    """مثل asyncio.to_thread لكن بلا تغليف ctx.run عندما يكون السياق فارغاً (الحالة المعتادة هنا)"""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(func, *args, **kwargs)
+    if context:
+        call = functools.partial(context.run, call)
+    return await loop.run_in_executor(None, call)
+
 class MultiAPIManager:
     """مدير متعدد مفاتيح API مع تحويل تلقائي عند تجاوز الحدود"""
 
     def __init__(self):
-        self.api_keys: List[dict] = []
-        self.current_key_index = 0
+        self.api_keys: List[KeyInfo] = []
+        # فهارس للبحث المباشر عن المفتاح بقيمته أو باسمه بدلاً من المرور على القائمة
+        self._by_key: dict = {}
+        self._by_name: dict = {}
+        # فهارس الحالة (مرتبة بترتيب الإضافة): المفاتيح المغلقة الجاهزة، والمفاتيح غير الجاهزة
+        # (المفتوحة في التهدئة ونصف المفتوحة أثناء طلبها التجريبي). تُحدَّث فقط عبر _set_state
+        self._active_keys: dict = {}
+        self._open_keys: dict = {}
         self.failed_keys = set()
+        # مجمع اتصالات HTTP/2 واحد لكل مفاتيح Gemini، يُنشأ عند أول استخدام على الحلقة الحالية
+        self._http: Optional[httpx.AsyncClient] = None
+        # قبول الطلبات: عداد الطلبات الجارية وشرط ينتظر عليه من تجاوز الحد (يُنشأ على الحلقة الحالية)
+        self._in_flight = 0
+        self._admission: Optional[asyncio.Condition] = None
+        # حالة الدوائر المحفوظة من التشغيل السابق حتى لا يُجرَّب مفتاح معطل فور إعادة التشغيل
+        self._saved_state = self._load_key_state()
+        # فتح دائرة يعلّم الحالة للحفظ؛ الكتابة تتم في خيط عبر flush_key_state ومحمية بقفل
+        self._state_dirty = False
+        self._save_lock = threading.Lock()
         self.load_api_keys()
 
+    @staticmethod
+    def _new_key_info(api_key: str, name: str, weight: int = 1) -> KeyInfo:
+        """بيانات مفتاح جديد بدائرة مغلقة"""
+        return KeyInfo(
+            key=api_key,
+            name=name,
+            masked=api_key[:10] + "..." + api_key[-5:] if len(api_key) > 15 else "***",
+            weight=max(1, weight),
+            limiter=AsyncLimiter(max_rate=KEY_REQUESTS_PER_MINUTE, time_period=60)
+        )
+
+    @staticmethod
+    def _key_fingerprint(api_key: str) -> str:
+        """بصمة ثابتة للمفتاح تُحفظ بدلاً منه"""
+        return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
+    def _load_key_state(self) -> dict:
+        """قراءة حالة المفاتيح المحفوظة"""
+        try:
+            with open(KEY_STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"تعذر قراءة حالة المفاتيح المحفوظة: {e}")
+            return {}
+
+    def _key_state_snapshot(self) -> dict:
+        """لقطة من حالة دوائر المفاتيح (مع تحويل المهلة الرتيبة إلى وقت الحائط)"""
+        wall_offset = time.time() - time.monotonic()
+        snapshot = {}
+        for key_info in self.api_keys:
+            is_open = key_info.state != KEY_CLOSED
+            snapshot[self._key_fingerprint(key_info.key)] = {
+                # المفتاح نصف المفتوح يُحفظ مفتوحاً حتى نهاية مهلة طلبه التجريبي ثم يُعطى طلباً تجريبياً جديداً
+                'state': KEY_OPEN if is_open else KEY_CLOSED,
+                'open_until': wall_offset + key_info.open_until if is_open else 0.0,
+                'failure_count': key_info.failure_count,
+                'priority': key_info.priority,
+                'usage_count': key_info.usage_count
+            }
+        return snapshot
+
+    def _write_key_state(self, snapshot: dict):
+        """كتابة اللقطة إلى الملف (آمنة للاستدعاء من خيط)"""
+        try:
+            # كتابة ذرية: ملف مؤقت ثم استبدال؛ القفل يمنع كتابتين متزامنتين على الملف المؤقت نفسه
+            with self._save_lock:
+                temp_file = f"{KEY_STATE_FILE}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f)
+                os.replace(temp_file, KEY_STATE_FILE)
+        except Exception as e:
+            logger.warning(f"تعذر حفظ حالة المفاتيح: {e}")
+
+    def save_key_state(self):
+        """حفظ حالة دوائر المفاتيح فوراً (للإغلاق فقط؛ المسارات غير المتزامنة تستخدم flush_key_state)"""
+        self._state_dirty = False
+        self._write_key_state(self._key_state_snapshot())
+
+    async def flush_key_state(self):
+        """حفظ الحالة إذا تغيرت، في خيط حتى لا تحجب الكتابة حلقة الأحداث"""
+        if not self._state_dirty:
+            return
+        self._state_dirty = False
+        # اللقطة تُؤخذ على الحلقة؛ الخيط يكتبها فقط
+        await _run_blocking(self._write_key_state, self._key_state_snapshot())
+
+    def _register_key(self, key_info: KeyInfo):
+        """إضافة المفتاح إلى القائمة والفهارس معاً"""
+        saved = self._saved_state.get(self._key_fingerprint(key_info.key))
+        if saved:
+            key_info.failure_count = saved.get('failure_count', 0)
+            key_info.priority = saved.get('priority', KEY_DEFAULT_PRIORITY)
+            key_info.usage_count = saved.get('usage_count', 0)
+            if saved.get('state') == KEY_OPEN:
+                key_info.state = KEY_OPEN
+                key_info.open_until = time.monotonic() + max(0.0, saved.get('open_until', 0.0) - time.time())
+
+        self.api_keys.append(key_info)
+        self._by_key[key_info.key] = key_info
+        self._by_name[key_info.name] = key_info
+        self._set_state(key_info, key_info.state)
+
+    def _set_state(self, key_info: KeyInfo, state: str):
+        """تغيير حالة دائرة المفتاح مع تحديث فهارس الحالة"""
+        key_info.state = state
+        self._active_keys.pop(key_info.key, None)
+        self._open_keys.pop(key_info.key, None)
+        if state == KEY_CLOSED:
+            self._active_keys[key_info.key] = key_info
+        else:
+            self._open_keys[key_info.key] = key_info
+
+    def get_key_info(self, api_key: str) -> Optional[KeyInfo]:
+        """بيانات المفتاح بقيمته، أو None إذا لم يكن مسجلاً"""
+        return self._by_key.get(api_key)
+
     def load_api_keys(self):
         """تحميل مفاتيح API من متغيرات البيئة"""
         # تحميل المفتاح الأساسي
         primary_key = os.getenv("GEMINI_API_KEY", "")
         if primary_key:
-            self.api_keys.append({
-                'key': primary_key,
-                'name': 'Primary',
-                'usage_count': 0,
-                'last_used': None,
-                'is_active': True
-            })
+            self._register_key(self._new_key_info(primary_key, 'Primary'))
 
         # تحميل مفاتيح إضافية (GEMINI_API_KEY_2, GEMINI_API_KEY_3, إلخ)
         for i in range(2, 10):  # يدعم حتى 9 مفاتيح
             key = os.getenv(f"GEMINI_API_KEY_{i}", "")
             if key:
-                self.api_keys.append({
-                    'key': key,
-                    'name': f'Secondary_{i}',
-                    'usage_count': 0,
-                    'last_used': None,
-                    'is_active': True
-                })
+                self._register_key(self._new_key_info(key, f'Secondary_{i}'))
 
         logger.info(f"تم تحميل {len(self.api_keys)} مفتاح API")
 
     def get_current_api_key(self) -> Optional[str]:
         """الحصول على مفتاح API الحالي"""
+        key_info = self.get_current_key_info()
+        return key_info.key if key_info else None
+
+    def get_current_key_info(self) -> Optional[KeyInfo]:
+        """الحصول على بيانات المفتاح الحالي كاملة"""
         if not self.api_keys:
             return None
 
-        active_keys = [k for k in self.api_keys if k['is_active']]
+        now = time.monotonic()
+        active_keys = self._active_keys.values()
         if not active_keys:
-            # إعادة تفعيل جميع المفاتيح إذا فشلت كلها
-            for key in self.api_keys:
-                key['is_active'] = True
-            active_keys = self.api_keys
-
-        # اختيار مفتاح عشوائي من المفاتيح النشطة
-        selected_key = random.choice(active_keys)
-        selected_key['usage_count'] += 1
-        selected_key['last_used'] = datetime.now()
-
-        return selected_key['key']
+            # انتهت تهدئة مفتاح مفتوح: يصبح نصف مفتوح ويُعطى لطلب تجريبي واحد فقط
+            # (لا يُختار مجدداً حتى يُستدعى mark_key_success أو mark_key_failed، أو تنتهي مهلة الطلب التجريبي)
+            for key_info in self._open_keys.values():
+                if now >= key_info.open_until:
+                    self._set_state(key_info, KEY_HALF_OPEN)
+                    key_info.open_until = now + KEY_PROBE_TIMEOUT
+                    active_keys = [key_info]
+                    break
+            else:
+                # كل المفاتيح في فترة التهدئة؛ لا داعي لإهدار طلبات ستُرفض
+                return None
+
+        # المفاتيح الأقل أولوية (التي فشلت مؤخراً) لا تُستخدم إلا إذا لم يبق غيرها
+        best_priority = min(k.priority for k in active_keys)
+        group = [k for k in active_keys if k.priority == best_priority]
+
+        # الأقل حملاً داخل المجموعة (الاستخدام نسبةً إلى الوزن، ثم الأقدم استخداماً):
+        # المفتاح ذو الوزن 2 يأخذ ضعف الطلبات، والمفتاح العائد من التعطيل يلحق بالبقية
+        selected_key = min(group, key=lambda k: (k.usage_count / k.weight, k.last_used or 0.0))
+        selected_key.usage_count += 1
+        selected_key.last_used = time.monotonic()
+
+        return selected_key
+
+    def get_client(self, api_key: str) -> genai.Client:
+        """عميل Gemini الخاص بالمفتاح (عميل مؤقت إذا لم يكن المفتاح مسجلاً)"""
+        key_info = self._by_key.get(api_key)
+        if key_info is None:
+            return self._create_client(api_key)
+        if key_info.client is None:
+            key_info.client = self._create_client(api_key)
+        return key_info.client
+
+    def get_limiter(self, api_key: str) -> AsyncLimiter:
+        """محدد معدل المفتاح (محدد مؤقت إذا لم يكن المفتاح مسجلاً)"""
+        key_info = self._by_key.get(api_key)
+        if key_info is None:
+            return AsyncLimiter(max_rate=KEY_REQUESTS_PER_MINUTE, time_period=60)
+        return key_info.limiter
+
+    def _create_client(self, api_key: str) -> genai.Client:
+        """عميل Gemini يرسل طلباته غير المتزامنة عبر المجمع المشترك فيعيد استخدام اتصالات TLS"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+        return genai.Client(
+            api_key=api_key,
+            http_options=genai_types.HttpOptions(httpx_async_client=self._http)
+        )
 
-    def mark_key_failed(self, api_key: str, error_message: str):
-        """تمييز مفتاح API كفاشل مؤقتاً"""
+    def admission_limit(self) -> int:
+        """الحد الحالي للطلبات المتزامنة: TRANSLATE_CONCURRENCY (حجم المنفذ نفسه) بنسبة المفاتيح غير المعطلة"""
+        if not self.api_keys:
+            return Config.TRANSLATE_CONCURRENCY
+        healthy_keys = len(self.api_keys) - len(self._open_keys)
+        return max(1, Config.TRANSLATE_CONCURRENCY * healthy_keys // len(self.api_keys))
+
+    @asynccontextmanager
+    async def admission(self):
+        """حجز مكان لطلب API ضمن الحد الديناميكي (بديل Semaphore ثابت الحجم)"""
+        if self._admission is None:
+            self._admission = asyncio.Condition()
+        cond = self._admission
+
+        async with cond:
+            # الحد يُعاد حسابه عند كل إيقاظ، فتغير حالة المفاتيح يسري على المنتظرين مباشرة
+            await cond.wait_for(lambda: self._in_flight < self.admission_limit())
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with cond:
+                self._in_flight -= 1
+                # إيقاظ بقدر الأماكن الشاغرة (قد تكون أكثر من واحد إذا كبر الحد منذ آخر تحرير)
+                cond.notify(max(1, self.admission_limit() - self._in_flight))
+
+    async def aclose(self):
+        """إغلاق مجمع الاتصالات وحفظ حالة المفاتيح؛ العملاء يُعاد إنشاؤهم عند الحاجة (حلقة أحداث جديدة بعد إعادة التشغيل)"""
+        self.save_key_state()
         for key_info in self.api_keys:
-            if key_info['key'] == api_key:
-                key_info['is_active'] = False
-                logger.warning(f"تم تعطيل مفتاح {key_info['name']} مؤقتاً: {error_message}")
-
-                # إعادة تفعيل المفتاح بعد 5 دقائق
-                asyncio.create_task(self._reactivate_key_after_delay(key_info, 300))
-                break
+            key_info.client = None
+        # الشرط مرتبط بحلقة الأحداث الحالية
+        self._admission = None
+        self._in_flight = 0
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
-    async def _reactivate_key_after_delay(self, key_info: dict, delay_seconds: int):
-        """إعادة تفعيل مفتاح API بعد فترة انتظار"""
-        await asyncio.sleep(delay_seconds)
-        key_info['is_active'] = True
-        logger.info(f"تم إعادة تفعيل مفتاح {key_info['name']}")
+    def mark_key_failed(self, api_key: str, error_message: str):
+        """تسجيل فشل مفتاح API وفتح دائرته عند تجاوز الحصة أو تكرار الفشل"""
+        key_info = self._by_key.get(api_key)
+        if key_info is None:
+            return
+
+        key_info.failure_count += 1
+        rate_limited = _QUOTA_RE.search(error_message) is not None
+
+        if (rate_limited or key_info.state == KEY_HALF_OPEN
+                or key_info.failure_count >= KEY_FAILURE_THRESHOLD):
+            # مدة التهدئة تتضاعف مع كل فشل حتى الحد الأقصى؛ لا مهمة خلفية، فقط طابع زمني
+            cooldown = min(KEY_MAX_OPEN_SECONDS, 2 ** key_info.failure_count)
+            self._set_state(key_info, KEY_OPEN)
+            key_info.open_until = time.monotonic() + cooldown
+            logger.warning(f"تم تعطيل مفتاح {key_info.name} لمدة {cooldown} ثانية: {error_message}")
+            # فتح الدائرة نادر ومهم: يُعلَّم للحفظ، ويكتبه flush_key_state خارج حلقة الأحداث
+            self._state_dirty = True
+        else:
+            key_info.priority += 1
+            logger.warning(f"فشل مفتاح {key_info.name} ({key_info.failure_count}/{KEY_FAILURE_THRESHOLD}): {error_message}")
+
+    def mark_key_success(self, api_key: str):
+        """نجاح طلب بالمفتاح: إغلاق الدائرة وتصفير عداد الفشل"""
+        key_info = self._by_key.get(api_key)
+        if key_info is None:
+            return
+        if key_info.state != KEY_CLOSED:
+            logger.info(f"تم إعادة تفعيل مفتاح {key_info.name}")
+        self._set_state(key_info, KEY_CLOSED)
+        key_info.priority = KEY_DEFAULT_PRIORITY
+        key_info.failure_count = 0
+        key_info.open_until = 0.0
 
     def get_status(self) -> dict:
         """الحصول على حالة جميع مفاتيح API"""
         status = {
             'total_keys': len(self.api_keys),
-            'active_keys': len([k for k in self.api_keys if k['is_active']]),
+            'active_keys': len(self.api_keys) - len(self._open_keys),
             'keys_info': []
         }
 
-        for i, key_info in enumerate(self.api_keys):
-            masked_key = key_info['key'][:10] + "..." + key_info['key'][-5:] if len(key_info['key']) > 15 else "***"
+        # فرق الساعتين لتحويل الطوابع الرتيبة إلى وقت الحائط
+        wall_offset = time.time() - time.monotonic()
+
+        for key_info in self.api_keys:
+            last_used = key_info.last_used
             status['keys_info'].append({
-                'name': key_info['name'],
-                'key': masked_key,
-                'active': key_info['is_active'],
-                'usage_count': key_info['usage_count'],
-                'last_used': key_info['last_used'].strftime('%H:%M:%S') if key_info['last_used'] else 'لم يُستخدم'
+                'name': key_info.name,
+                'key': key_info.masked,
+                'active': key_info.state == KEY_CLOSED,
+                'state': key_info.state,
+                'usage_count': key_info.usage_count,
+                'last_used': datetime.fromtimestamp(wall_offset + last_used).strftime('%H:%M:%S') if last_used is not None else 'لم يُستخدم'
             })
 
         return status
 
-    def add_api_key(self, api_key: str, name: str = None) -> bool:
-        """إضافة مفتاح API جديد"""
+    def add_api_key(self, api_key: str, name: str = None, weight: int = 1) -> bool:
+        """إضافة مفتاح API جديد (الوزن الأكبر يعني حصة أكبر من الطلبات، مثل المفاتيح المدفوعة)"""
         if not name:
             name = f"Manual_{len(self.api_keys) + 1}"
 
         # التحقق من عدم وجود المفتاح مسبقاً
-        for existing_key in self.api_keys:
-            if existing_key['key'] == api_key:
-                return False
-
-        self.api_keys.append({
-            'key': api_key,
-            'name': name,
-            'usage_count': 0,
-            'last_used': None,
-            'is_active': True
-        })
+        if api_key in self._by_key:
+            return False
+
+        self._register_key(self._new_key_info(api_key, name, weight))
 
         logger.info(f"تم إضافة مفتاح API جديد: {name}")
         return True
 
     def remove_api_key(self, key_name: str) -> bool:
         """حذف مفتاح API"""
-        for i, key_info in enumerate(self.api_keys):
-            if key_info['name'] == key_name:
-                del self.api_keys[i]
-                logger.info(f"تم حذف مفتاح API: {key_name}")
-                return True
-        return False
+        key_info = self._by_name.pop(key_name, None)
+        if key_info is None:
+            return False
+
+        del self._by_key[key_info.key]
+        self._active_keys.pop(key_info.key, None)
+        self._open_keys.pop(key_info.key, None)
+        self.api_keys.remove(key_info)
+        logger.info(f"تم حذف مفتاح API: {key_name}")
+        return True
 
 class MultiGeminiTranslatorManager:
     """مدير ترجمة متعدد مع إدارة مفاتيح API ودعم Groq كخدمة احتياطية"""
@@ -144,7 +423,6 @@ class MultiGeminiTranslatorManager:
         self.api_keys = api_keys if api_keys else []
         self.model = model
         self.current_key_index = 0
-        self.semaphore = asyncio.Semaphore(8)
 
         # Groq configuration
         self.groq_api_key = os.getenv("GROQ_API_KEY", "")
@@ -153,7 +431,7 @@ class MultiGeminiTranslatorManager:
 
         if self.groq_api_key:
             try:
-                self.groq_client = Groq(api_key=self.groq_api_key)
+                self.groq_client = AsyncGroq(api_key=self.groq_api_key)
                 logger.info("Groq client initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Groq client: {e}")
@@ -162,21 +440,19 @@ class MultiGeminiTranslatorManager:
         for i, key in enumerate(self.api_keys):
             multi_api_manager.add_api_key(key, f"Config_Key_{i+1}")
 
+    async def aclose(self):
+        """إغلاق اتصالات HTTP المشتركة لعملاء Gemini"""
+        await multi_api_manager.aclose()
+
     async def translate_with_groq(self, text: str) -> str:
         """ترجمة باستخدام Groq كخدمة احتياطية"""
         if not self.groq_client or not text.strip():
             return text
 
         try:
-            messages = [
-                {
-                    "role": "user",
-                    "content": f"Translate the following English text to Arabic. Return only the Arabic translation without any explanations:\n\n{text.strip()}"
-                }
-            ]
-
-            completion = await asyncio.to_thread(
-                self.groq_client.chat.completions.create,
+            messages = [{"role": "user", "content": GROQ_TRANSLATION_PROMPT + text.strip()}]
+
+            completion = await self.groq_client.chat.completions.create(
                 model=self.groq_model,
                 messages=messages,
                 temperature=0.3,
@@ -200,28 +476,24 @@ class MultiGeminiTranslatorManager:
             return ""
             
         try:
-            # Use local translator instead of external APIs
-            from local_translator import LocalTranslator
-            local_translator = LocalTranslator()
-            translated = await local_translator.translate_text(text)
+            # Use local translator instead of external APIs (shared instance, dictionary loaded once)
+            translated = get_local_translator().translate_text(text)
             return translated
         except Exception as e:
             logger.error(f"Local translation failed: {e}")
             return text
 
-    async def translate_lines_with_progress(self, lines: List[str], progress_callback: Callable = None) -> List[Tuple[str, str]]:
-        """ترجمة عدة أسطر باستخدام القاموس المحلي"""
+    async def _translate_lines_locally(self, lines: List[str], progress_callback: Optional[Callable], total: int) -> List[Tuple[str, str]]:
+        """المسار المشترك لكل طرق الترجمة الدفعية: القاموس المحلي مع تقرير التقدم في البداية والنهاية"""
         try:
             if progress_callback:
-                await progress_callback(0, 100, "بدء الترجمة باستخدام القاموس المحلي")
+                await progress_callback(0, total, "بدء الترجمة باستخدام القاموس المحلي")
 
-            # Use local translator instead of external APIs
-            from local_translator import LocalTranslator
-            local_translator = LocalTranslator()
-            result = await local_translator.translate_lines(lines)
+            # Use local translator instead of external APIs (shared instance, dictionary loaded once)
+            result = await _run_blocking(get_local_translator().translate_lines, lines)
 
             if progress_callback:
-                await progress_callback(100, 100, "اكتملت الترجمة باستخدام القاموس المحلي")
+                await progress_callback(total, total, "اكتملت الترجمة باستخدام القاموس المحلي")
 
             return result
         except Exception as e:
@@ -229,88 +501,49 @@ class MultiGeminiTranslatorManager:
             # Return original text as fallback
             return [(line, line) for line in lines]
 
+    async def translate_lines_with_progress(self, lines: List[str], progress_callback: Callable = None) -> List[Tuple[str, str]]:
+        """ترجمة عدة أسطر باستخدام القاموس المحلي"""
+        return await self._translate_lines_locally(lines, progress_callback, 100)
+
     async def translate_batch_with_groq(self, lines: List[str], progress_callback: Callable = None) -> List[Tuple[str, str]]:
         """ترجمة دفعية باستخدام القاموس المحلي"""
-        try:
-            if progress_callback:
-                await progress_callback(0, 100, "بدء الترجمة باستخدام القاموس المحلي")
-
-            # Use local translator instead of external APIs
-            from local_translator import LocalTranslator
-            local_translator = LocalTranslator()
-            result = await local_translator.translate_lines(lines)
-
-            if progress_callback:
-                await progress_callback(100, 100, "اكتملت الترجمة باستخدام القاموس المحلي")
-
-            return result
-        except Exception as e:
-            logger.error(f"Local batch translation failed: {e}")
-            # Return original text as fallback
-            return [(line, line) for line in lines]
+        return await self._translate_lines_locally(lines, progress_callback, 100)
 
     async def translate_batch_with_progress(self, lines: List[str], progress_callback: Callable = None) -> List[Tuple[str, str]]:
         """ترجمة النص باستخدام القاموس المحلي"""
-        try:
-            if progress_callback:
-                await progress_callback(0, 100, "بدء الترجمة باستخدام القاموس المحلي")
-
-            # Use local translator instead of external APIs
-            from local_translator import LocalTranslator
-            local_translator = LocalTranslator()
-            result = await local_translator.translate_lines(lines)
-
-            if progress_callback:
-                await progress_callback(100, 100, "اكتملت الترجمة باستخدام القاموس المحلي")
-
-            return result
-        except Exception as e:
-            logger.error(f"Local batch translation failed: {e}")
-            # Return original text as fallback
-            return [(line, line) for line in lines]
+        return await self._translate_lines_locally(lines, progress_callback, 100)
 
     async def translate_lines_fallback(self, lines: List[str], progress_callback: Callable = None) -> List[Tuple[str, str]]:
         """طريقة احتياطية - ترجمة باستخدام القاموس المحلي"""
         logger.info("Using local dictionary translation")
-        try:
-            if progress_callback:
-                await progress_callback(0, len(lines), "بدء الترجمة باستخدام القاموس المحلي")
-
-            # Use local translator instead of external APIs
-            from local_translator import LocalTranslator
-            local_translator = LocalTranslator()
-            result = await local_translator.translate_lines(lines)
-
-            if progress_callback:
-                await progress_callback(len(lines), len(lines), "اكتملت الترجمة باستخدام القاموس المحلي")
-
-            return result
-        except Exception as e:
-            logger.error(f"Local fallback translation failed: {e}")
-            # Return original text as fallback
-            return [(line, line) for line in lines]
+        return await self._translate_lines_locally(lines, progress_callback, len(lines))
 
     def get_all_keys(self) -> List[str]:
         """الحصول على جميع مفاتيح API"""
-        return [key_info['key'] for key_info in multi_api_manager.api_keys]
+        return [key_info.key for key_info in multi_api_manager.api_keys]
 
     async def check_key_status(self, api_key: str) -> str:
         """فحص حالة مفتاح API"""
         try:
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel(self.model)
+            client = multi_api_manager.get_client(api_key)
 
-            response = await asyncio.wait_for(
-                asyncio.to_thread(model.generate_content, "Hello"),
-                timeout=10
-            )
+            # انتظار رمز من حصة المفتاح أولاً حتى لا يشغل الطلب مكاناً في القبول وهو ينتظر
+            # واجهة SDK غير المتزامنة الأصلية: لا خيط لكل طلب
+            async with multi_api_manager.get_limiter(api_key), multi_api_manager.admission():
+                response = await asyncio.wait_for(
+                    client.aio.models.generate_content(model=self.model, contents="Hello"),
+                    timeout=10
+                )
 
             if response and response.text:
+                multi_api_manager.mark_key_success(api_key)
                 return "يعمل بشكل طبيعي"
             else:
                 return "لا يستجيب"
 
         except Exception as e:
+            multi_api_manager.mark_key_failed(api_key, str(e))
+            await multi_api_manager.flush_key_state()
             return f"خطأ: {str(e)}"
 
     def add_key(self, api_key: str) -> bool:
@@ -319,10 +552,10 @@ class MultiGeminiTranslatorManager:
 
     def remove_key(self, api_key: str) -> bool:
         """حذف مفتاح API"""
-        for key_info in multi_api_manager.api_keys:
-            if key_info['key'] == api_key:
-                return multi_api_manager.remove_api_key(key_info['name'])
-        return False
+        key_info = multi_api_manager.get_key_info(api_key)
+        if key_info is None:
+            return False
+        return multi_api_manager.remove_api_key(key_info.name)
 
 # إنشاء مثيل عام
 multi_api_manager = MultiAPIManager()
\ No newline at end of file
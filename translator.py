@@ -9,7 +9,7 @@ from typing import List, Tuple
 import os
 
 # Import the local translator as the primary translation method
-from local_translator import LocalTranslator
+from local_translator import get_local_translator
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,8 @@ class LocalDictionaryTranslator:
         """
         Initialize the local dictionary translator.
         """
-        self.local_translator = LocalTranslator()
+        # Shared instance: the dictionary and its caches are built once per process
+        self.local_translator = get_local_translator()
         
     async def translate_lines(self, lines: List[str]) -> List[Tuple[str, str]]:
         """
@@ -38,7 +39,7 @@ class LocalDictionaryTranslator:
         """
         try:
             logger.info(f"Translating {len(lines)} lines using local dictionary")
-            return await self.local_translator.translate_lines(lines)
+            return await asyncio.to_thread(self.local_translator.translate_lines, lines)
 
         except Exception as e:
             logger.error(f"Local translation failed: {e}")
@@ -50,7 +51,7 @@ class LocalDictionaryTranslator:
             return ""
             
         try:
-            translated = await self.local_translator.translate_text(text)
+            translated = self.local_translator.translate_text(text)
             return translated
         except Exception as e:
             logger.error(f"Single line translation failed: {e}")
@@ -93,7 +94,7 @@ class LocalDictionaryTranslator:
             combined_text = " ".join(chunk)
             
             # Translate the combined text
-            translated_text = await self.local_translator.translate_text(combined_text)
+            translated_text = self.local_translator.translate_text(combined_text)
             
             # Create pairs - one pair per chunk for better formatting
             original_combined = " ".join(chunk)
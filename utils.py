@@ -14,156 +14,6 @@ from datetime import datetime, timedelta
 logger = logging.getLogger(__name__)
 
 
-class RateLimiter:
-    """Rate limiter with user tracking capabilities."""
-    
-    def __init__(self, max_per_hour: int):
-        self.max_per_hour = max_per_hour
-        self.user_requests: Dict[int, List[datetime]] = {}
-    
-    def can_process(self, user_id: int) -> bool:
-        """Check if user can process a file."""
-        now = datetime.now()
-        one_hour_ago = now - timedelta(hours=1)
-        
-        # Clean old requests
-        if user_id in self.user_requests:
-            self.user_requests[user_id] = [
-                req_time for req_time in self.user_requests[user_id] 
-                if req_time > one_hour_ago
-            ]
-        
-        # Check limit
-        user_count = len(self.user_requests.get(user_id, []))
-        return user_count < self.max_per_hour
-    
-    def record_processing(self, user_id: int):
-        """Record a file processing for a user."""
-        now = datetime.now()
-        if user_id not in self.user_requests:
-            self.user_requests[user_id] = []
-        self.user_requests[user_id].append(now)
-    
-    def get_user_count(self, user_id: int) -> int:
-        """Get current hourly count for a user."""
-        now = datetime.now()
-        one_hour_ago = now - timedelta(hours=1)
-        
-        if user_id not in self.user_requests:
-            return 0
-        
-        # Clean old requests and count
-        valid_requests = [
-            req_time for req_time in self.user_requests[user_id] 
-            if req_time > one_hour_ago
-        ]
-        self.user_requests[user_id] = valid_requests
-        return len(valid_requests)
-    
-    def get_next_reset_time(self, user_id: int) -> datetime:
-        """Get the time when the user's hourly limit resets."""
-        if user_id not in self.user_requests or not self.user_requests[user_id]:
-            return None
-        
-        # Find the oldest request in the current hour
-        now = datetime.now()
-        one_hour_ago = now - timedelta(hours=1)
-        
-        valid_requests = [
-            req_time for req_time in self.user_requests[user_id] 
-            if req_time > one_hour_ago
-        ]
-        
-        if not valid_requests:
-            return None
-        
-        oldest_request = min(valid_requests)
-        return oldest_request + timedelta(hours=1)
-
-
-class DailyRateLimiter:
-    """Daily rate limiter with user tracking capabilities."""
-    
-    def __init__(self, max_per_day: int):
-        self.max_per_day = max_per_day
-        self.user_requests: Dict[int, List[datetime]] = {}
-        self.data_file = Path("daily_usage.json")
-        self._load_data()
-    
-    def _load_data(self):
-        """Load daily usage data from file."""
-        try:
-            if self.data_file.exists():
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Convert timestamps back to datetime objects
-                    for user_id, timestamps in data.items():
-                        self.user_requests[int(user_id)] = [
-                            datetime.fromisoformat(ts) for ts in timestamps
-                        ]
-        except Exception as e:
-            logger.warning(f"Failed to load daily usage data: {e}")
-    
-    def _save_data(self):
-        """Save daily usage data to file."""
-        try:
-            # Convert datetime objects to ISO format strings
-            data = {}
-            for user_id, timestamps in self.user_requests.items():
-                data[str(user_id)] = [ts.isoformat() for ts in timestamps]
-            
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.warning(f"Failed to save daily usage data: {e}")
-    
-    def can_process(self, user_id: int) -> bool:
-        """Check if user can process a file today."""
-        now = datetime.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        # Clean old requests (older than today)
-        if user_id in self.user_requests:
-            self.user_requests[user_id] = [
-                req_time for req_time in self.user_requests[user_id] 
-                if req_time >= today_start
-            ]
-        
-        # Check limit
-        user_count = len(self.user_requests.get(user_id, []))
-        return user_count < self.max_per_day
-    
-    def record_processing(self, user_id: int):
-        """Record a file processing for a user."""
-        now = datetime.now()
-        if user_id not in self.user_requests:
-            self.user_requests[user_id] = []
-        self.user_requests[user_id].append(now)
-        self._save_data()
-    
-    def get_user_count(self, user_id: int) -> int:
-        """Get current daily count for a user."""
-        now = datetime.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        if user_id not in self.user_requests:
-            return 0
-        
-        # Clean old requests and count
-        valid_requests = [
-            req_time for req_time in self.user_requests[user_id] 
-            if req_time >= today_start
-        ]
-        self.user_requests[user_id] = valid_requests
-        return len(valid_requests)
-    
-    def get_next_reset_time(self, user_id: int) -> datetime:
-        """Get the time when the user's daily limit resets (next midnight)."""
-        now = datetime.now()
-        tomorrow_start = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        return tomorrow_start
-
-
 class FileCleanupManager:
     """Manages cleanup of temporary files."""
 